@@ -0,0 +1,153 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""asyncio integration benchmark
+
+Compares mmtk.aio.TkDriver against the usual pattern of running the Tk
+mainloop and stepping the asyncio loop from a root.after(10, poll)
+callback.  For each, reports:
+
+- idle CPU: process CPU time as a fraction of wall time while idle
+- update latency: time from an asyncio task updating a StatusLabel
+  until Tk has processed the resulting idle (redraw) events
+- Tk event latency: time from when a Tk `after` timer is due until a
+  virtual event it generates has been handled.  This stands in for input
+  and other events originating in Tk, which (unlike asyncio updates) get
+  no `wake` and wait for the driver's next pass.
+
+Usage: python benchmarks/bench_aio.py [seconds]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mmtk import StatusLabel
+from mmtk.aio import TkDriver, wake
+
+
+async def measure(root, label, seconds):
+    """Idles, then updates the label every 50 ms.
+
+    Returns (tuple): (idle cpu fraction, list of update latencies)
+    """
+    wall, cpu = time.perf_counter(), time.process_time()
+    await asyncio.sleep(seconds)
+    idle = (time.process_time() - cpu) / (time.perf_counter() - wall)
+
+    latencies = []
+    for i in range(int(seconds / 0.05)):
+        done = asyncio.Event()
+        start = time.perf_counter()
+
+        def processed():
+            latencies.append(time.perf_counter() - start)
+            done.set()
+
+        label.info(f"update {i}")
+        root.after_idle(processed)
+        wake(label)
+        await done.wait()
+        await asyncio.sleep(0.05)
+
+    return idle, latencies
+
+
+async def measure_tk_events(root, seconds):
+    """Every 50 ms, schedules a Tk timer which generates a virtual event
+    (without waking the driver).
+
+    Returns (list): latencies from when each timer was due until its
+    event was handled
+    """
+    latencies = []
+    handled = asyncio.Event()
+    due = 0.0
+
+    def on_event(event):
+        latencies.append(time.perf_counter() - due)
+        handled.set()
+
+    root.bind("<<BenchEvent>>", on_event)
+    for i in range(int(seconds / 0.05)):
+        handled.clear()
+        due = time.perf_counter() + 0.02
+        root.after(20, root.event_generate, "<<BenchEvent>>")
+        await handled.wait()
+        await asyncio.sleep(0.05)
+
+    return latencies
+
+
+def bench_driver(seconds, **kwargs):
+    """Any kwargs are passed to the TkDriver constructor"""
+    async def main():
+        root = tk.Tk()
+        label = StatusLabel(root)
+        label.pack()
+        driver = TkDriver(root, **kwargs)
+        task = asyncio.create_task(driver.run())
+        result = await measure(root, label, seconds)
+        events = await measure_tk_events(root, seconds)
+        root.destroy()
+        await task
+        return (*result, events)
+
+    return asyncio.run(main())
+
+
+def bench_poll(seconds):
+    root = tk.Tk()
+    label = StatusLabel(root)
+    label.pack()
+    loop = asyncio.new_event_loop()
+    result = []
+
+    def poll():
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+        root.after(10, poll)
+
+    async def main():
+        result.extend(await measure(root, label, seconds))
+        result.append(await measure_tk_events(root, seconds))
+        root.quit()
+
+    loop.create_task(main())
+    root.after(10, poll)
+    root.mainloop()
+    root.destroy()
+    loop.close()
+    return tuple(result)
+
+
+def main(seconds=2.0):
+    benches = (
+        ("TkDriver", bench_driver),
+        ("TkDriver(max_interval=0.01)",
+            lambda seconds: bench_driver(seconds, max_interval=0.01)),
+        ("after(10)", bench_poll),
+    )
+    for name,bench in benches:
+        idle, latencies, events = bench(seconds)
+        print(name)
+        print(f"  idle cpu:         {100*idle:5.2f}%")
+        print(
+            f"  update latency:   mean {1000*statistics.mean(latencies):6.2f} ms, "
+            f"max {1000*max(latencies):6.2f} ms"
+        )
+        print(
+            f"  Tk event latency: mean {1000*statistics.mean(events):6.2f} ms, "
+            f"max {1000*max(events):6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*(float(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,69 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""mmtk import time benchmark
+
+Measures the cost of `import mmtk` in a fresh interpreter using
+`python -X importtime`, which reports the cumulative time of each
+import.  Also reports the cost of first accessing the widget classes
+(which are loaded lazily).
+
+Usage: python benchmarks/bench_import.py [repeat]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+
+def import_time(code="import mmtk", module="mmtk"):
+    """Runs code in a fresh interpreter under -X importtime.
+    Returns the cumulative import time (seconds) of the named module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    # lines look like "import time:   self [us] |  cumulative | name"
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return 1e-6 * int(fields[1])
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def bench_import(repeat=10):
+    """Returns the median time of `import mmtk`"""
+    return statistics.median(import_time() for _ in range(repeat))
+
+
+def bench_first_access(name, repeat=10):
+    """Returns the median time of the first access of mmtk.<name> (which
+    loads its submodule) after `import mmtk`, each in a fresh interpreter.
+    (-X importtime does not report modules loaded via importlib)"""
+    code = (
+        "import time, mmtk; start = time.perf_counter(); "
+        f"mmtk.{name}; print(time.perf_counter() - start)"
+    )
+    samples = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        samples.append(float(result.stdout))
+    return statistics.median(samples)
+
+
+def main(repeat=10):
+    print(f"import mmtk:                  {1e3*bench_import(repeat):.2f} ms")
+    for name in ("StatusLabel", "PlaceholderEntry", "StatusChannel"):
+        print(f"first mmtk.{name+':':18s} "
+              f"{1e3*bench_first_access(name, repeat):.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
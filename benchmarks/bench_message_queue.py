@@ -0,0 +1,53 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""StatusLabel message queue benchmark
+
+Floods a StatusLabel whose error is held on screen (min_display) with
+info messages, reporting the cost per message for a range of queue
+lengths.  The cost should grow only logarithmically with the queue
+length.
+
+Usage: python benchmarks/bench_message_queue.py [count]
+"""
+
+import os
+import sys
+import time
+
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mmtk import StatusLabel
+
+
+def bench_flood(root, count=100000, max_queued=100):
+    """Posts an error followed by count info messages with a mix of
+    severities.  Returns the mean time per message."""
+    label = StatusLabel(root, min_display={"error": 60}, max_queued=max_queued)
+    label.error("held")
+    methods = (label.info, label.info, label.info, label.warning)
+    start = time.perf_counter()
+    for i in range(count):
+        methods[i % 4](f"message {i}")
+    elapsed = time.perf_counter() - start
+    label.destroy()
+    return elapsed / count
+
+
+def main(count=100000):
+    root = tk.Tk()
+    root.withdraw()
+
+    print(f"{count} messages")
+    for max_queued in (10, 100, 1000, 10000, 100000):
+        per = bench_flood(root, count, max_queued)
+        print(f"max_queued {max_queued:7d}: {1e6*per:.2f} us/message")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,78 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""StatusLabel option storage microbenchmarks
+
+Reports the Python memory (as traced by tracemalloc) held by each of the
+Option, FontOption, and Synonym classes, and the cost of the value
+lookups made on the StatusLabel hot paths.
+
+Usage: python benchmarks/bench_options.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mmtk.status_label import FontOption, Option, Options, Synonym
+
+
+def bench_memory(factory, count=10000):
+    """Returns the memory (bytes) per object created by factory"""
+    objects = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(count):
+        objects.append(factory())
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def bench_lookup(func, iterations=100000):
+    """Returns the mean time (seconds) per call of func"""
+    return timeit.timeit(func, number=iterations) / iterations
+
+
+def main(iterations=100000):
+    root = tk.Tk()
+    root.withdraw()
+
+    background = Option("background", warning="#fc8", error="#f00")
+    bold = FontOption("bold", error=True)
+    options = {"background":background}
+
+    print("memory per instance:")
+    for name, factory in (
+        ("Option", lambda: Option("background", error="#f00")),
+        ("Option.copy", background.copy),
+        ("FontOption", lambda: FontOption("bold", error=True)),
+        ("Synonym", lambda: Synonym("bg", options)),
+    ):
+        print(f"  {name:22s} {bench_memory(factory):8.0f} bytes")
+
+    options = Options(infobg="green")
+    print("lookups:")
+    for name, func in (
+        ("Option._get_config", lambda: background._get_config(2)),
+        ("Option.value", lambda: background.value("warning")),
+        ("Option.config_entry", lambda: background.config_entry("warning")),
+        ("FontOption._get_config", lambda: bold._get_config(3)),
+        ("Options.cget", lambda: options.cget("warningbg")),
+        ("Options.kwargs (cached)", lambda: options.kwargs("warning")),
+        ("Options.kwargs (rebuilt)",
+            lambda: (options._invalidate(2), options.kwargs("warning"))),
+    ):
+        print(f"  {name:22s} {1e9*bench_lookup(func, iterations):8.0f} ns")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
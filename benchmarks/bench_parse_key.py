@@ -0,0 +1,69 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""Option key parsing benchmark
+
+Compares the table driven parse_key against the regex based parser it
+replaced, and reports Options.cget/configure throughput.
+
+Usage: python benchmarks/bench_parse_key.py [iterations]
+"""
+
+import os
+import re
+import sys
+import timeit
+
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mmtk.status_label import Options, StatusStates, parse_key
+
+
+def regex_parse_key(key):
+    """The original (regex based) implementation of parse_key"""
+    states = "|".join(StatusStates)
+    m = re.match(rf"({states})_?(.*)",key)
+    return (m.group(2), m.group(1)) if m else (key,None)
+
+
+KEYS = ("background", "infobg", "warning_foreground", "errorbold", "relief")
+
+
+def rate(func, iterations, calls=1):
+    """Returns calls per second when func (which makes the specified
+    number of calls) is invoked the specified number of iterations"""
+    elapsed = timeit.timeit(func, number=iterations)
+    return calls * iterations / elapsed
+
+
+def main(iterations=100000):
+    root = tk.Tk()
+    root.withdraw()
+
+    options = Options()
+
+    results = {
+        "regex parse_key": rate(
+            lambda: [regex_parse_key(k) for k in KEYS], iterations, len(KEYS)),
+        "table parse_key": rate(
+            lambda: [parse_key(k) for k in KEYS], iterations, len(KEYS)),
+        "Options.cget": rate(
+            lambda: [options.cget(k) for k in KEYS], iterations//10, len(KEYS)),
+        "Options.configure(key)": rate(
+            lambda: [options.configure(k) for k in KEYS], iterations//10, len(KEYS)),
+        "Options.configure(**kw)": rate(
+            lambda: options.configure(infobg="green", errorrelief="groove"),
+            iterations//10),
+    }
+
+    for name,value in results.items():
+        print(f"{name:25s} {value:12,.0f} calls/s")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
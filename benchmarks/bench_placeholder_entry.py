@@ -0,0 +1,123 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""PlaceholderEntry benchmark
+
+Constructs a form of PlaceholderEntry widgets and reports the
+construction time, the number of distinct ttk styles used by the
+entries, the time per focus change (in both placeholder modes), the
+time needed to read the values of all of the entries (as on submitting
+the form), and the time needed to switch ttk themes.
+
+Usage: python benchmarks/bench_placeholder_entry.py [count]
+"""
+
+import os
+import sys
+import time
+
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mmtk import PlaceholderEntry
+
+
+def bench_construction(root, count, **kwargs):
+    """Returns (entries, construction time per entry).  Any kwargs are
+    passed to the PlaceholderEntry constructor."""
+    start = time.perf_counter()
+    entries = [
+        PlaceholderEntry(root, f"entry {i}", **kwargs) for i in range(count)
+    ]
+    elapsed = time.perf_counter() - start
+    return entries, elapsed / count
+
+
+def bench_focus_storm(entries, rounds=5):
+    """Sends FocusIn/FocusOut to every entry in turn (as tab traversal
+    through the form would).  Returns the mean time per focus change."""
+    start = time.perf_counter()
+    for i in range(rounds):
+        for entry in entries:
+            entry.event_generate("<FocusIn>")
+            entry.event_generate("<FocusOut>")
+    elapsed = time.perf_counter() - start
+    return elapsed / (2 * rounds * len(entries))
+
+
+def bench_read_values(entries, rounds=5):
+    """Reads the value of every entry (as submitting the form would).
+    Returns the mean time per read via the value property and via get()"""
+    start = time.perf_counter()
+    for i in range(rounds):
+        values = [entry.value for entry in entries]
+    cached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        values = [
+            "" if entry.showing_placeholder else entry.get()
+            for entry in entries
+        ]
+    direct = time.perf_counter() - start
+
+    reads = rounds * len(entries)
+    return cached / reads, direct / reads
+
+
+def bench_theme_switch(root, themes, repeat=5):
+    """Returns the mean time to switch themes"""
+    style = ttk.Style(root)
+    elapsed = 0.0
+    for i in range(repeat):
+        for theme in themes:
+            start = time.perf_counter()
+            style.theme_use(theme)
+            root.update_idletasks()
+            elapsed += time.perf_counter() - start
+    return elapsed / (repeat * len(themes))
+
+
+def main(count=2000):
+    root = tk.Tk()
+
+    entries, per_entry = bench_construction(root, count)
+    for entry in entries:
+        entry.pack()
+    root.update()
+
+    styles = {str(entry['style']) for entry in entries}
+    focus = bench_focus_storm(entries)
+    cached, direct = bench_read_values(entries)
+
+    frame = ttk.Frame(root)
+    overlays, per_overlay = bench_construction(
+        frame, count, placeholder_mode="overlay")
+    for entry in overlays:
+        entry.pack()
+    frame.pack()
+    root.update()
+    overlay_focus = bench_focus_storm(overlays)
+    frame.destroy()
+
+    themes = ("clam", "alt", "default")
+    switch = bench_theme_switch(root, themes)
+
+    print(f"entries:            {count}")
+    print(f"construction time:  {1e6*per_entry:.1f} us/entry")
+    print(f"placeholder styles: {len(styles)}")
+    print(f"focus change:       {1e6*focus:.1f} us")
+    print(f"value read:         {1e6*cached:.2f} us (get(): {1e6*direct:.2f} us)")
+    print("overlay mode:")
+    print(f"  construction time:  {1e6*per_overlay:.1f} us/entry")
+    print(f"  focus change:       {1e6*overlay_focus:.1f} us")
+    print(f"theme switch:       {1000*switch:.2f} ms")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
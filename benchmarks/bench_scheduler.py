@@ -0,0 +1,78 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""Scheduler benchmark
+
+Compares scheduling and cancelling timers on the shared mmtk TimerWheel
+with creating a Tk `after` timer for each, as is needed when many
+StatusLabels auto-clear their errors.
+
+Usage: python benchmarks/bench_scheduler.py [count]
+"""
+
+import os
+import sys
+import time
+
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mmtk.scheduler import TimerWheel
+
+
+def noop():
+    pass
+
+
+def bench_wheel(root, count=10000):
+    """Returns the mean time to schedule and then cancel a timer on a
+    TimerWheel with count timers pending"""
+    wheel = TimerWheel(root)
+    start = time.perf_counter()
+    timers = [wheel.schedule(5 + i % 100, noop) for i in range(count)]
+    for timer in timers:
+        timer.cancel()
+    elapsed = time.perf_counter() - start
+    wheel.stop()
+    return elapsed / count
+
+
+def bench_reschedule(root, count=10000):
+    """Returns the mean time to reschedule a pending timer"""
+    wheel = TimerWheel(root)
+    timers = [wheel.schedule(5, noop) for i in range(count)]
+    start = time.perf_counter()
+    for i, timer in enumerate(timers):
+        timer.reschedule(5 + i % 100)
+    elapsed = time.perf_counter() - start
+    wheel.stop()
+    return elapsed / count
+
+
+def bench_after(root, count=10000):
+    """Returns the mean time to create and then cancel a Tk after timer
+    with count timers pending"""
+    start = time.perf_counter()
+    ids = [root.after(5000 + 10 * (i % 100), noop) for i in range(count)]
+    for after_id in ids:
+        root.after_cancel(after_id)
+    elapsed = time.perf_counter() - start
+    return elapsed / count
+
+
+def main(count=10000):
+    root = tk.Tk()
+    root.withdraw()
+
+    print(f"{count} timers")
+    print(f"TimerWheel schedule+cancel: {1e6*bench_wheel(root, count):.2f} us")
+    print(f"TimerWheel reschedule:      {1e6*bench_reschedule(root, count):.2f} us")
+    print(f"Tk after+after_cancel:      {1e6*bench_after(root, count):.2f} us")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
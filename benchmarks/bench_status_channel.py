@@ -0,0 +1,78 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""StatusChannel stress test
+
+Runs 16 producer threads which together post 1,000,000 status updates
+to a set of StatusLabels through a single StatusChannel while the Tk
+event loop runs on the main thread.  Reports throughput, end-to-end
+latency, and the number of coalesced and dropped updates.
+
+Usage: python benchmarks/bench_status_channel.py [updates] [threads] [labels]
+"""
+
+import os
+import sys
+import threading
+import time
+
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mmtk import StatusChannel, StatusLabel
+
+
+def main(updates=1000000, producers=16, labels=32):
+    root = tk.Tk()
+
+    channel = StatusChannel(root)
+    widgets = [StatusLabel(root, channel=channel) for _ in range(labels)]
+    for widget in widgets:
+        widget.pack()
+
+    states = ("info", "warning", "error", None)
+    per_thread = updates // producers
+
+    def produce(thread):
+        for i in range(per_thread):
+            widget = widgets[(thread + i) % labels]
+            widget.post(states[i % 4], f"{thread}:{i}")
+
+    threads = [
+        threading.Thread(target=produce, args=(t,), daemon=True)
+        for t in range(producers)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+
+    def check_done():
+        if any(thread.is_alive() for thread in threads):
+            root.after(50, check_done)
+        else:
+            channel.drain()
+            root.quit()
+
+    root.after(50, check_done)
+    root.mainloop()
+    elapsed = time.perf_counter() - start
+
+    stats = channel.stats()
+    print(f"producers:     {producers}")
+    print(f"labels:        {labels}")
+    print(f"elapsed:       {elapsed:.2f} s")
+    print(f"throughput:    {stats['posted']/elapsed:,.0f} updates/s")
+    for key in ("posted", "delivered", "coalesced", "dropped", "discarded"):
+        print(f"{key+':':14s} {stats[key]:,}")
+    print(f"mean latency:  {1000*stats['mean_latency']:.2f} ms")
+    print(f"max latency:   {1000*stats['max_latency']:.2f} ms")
+
+    channel.close()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
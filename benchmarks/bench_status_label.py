@@ -0,0 +1,185 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""StatusLabel construction benchmark
+
+Reports the per-instance construction time and the number of Tk widgets
+that exist after constructing a batch of StatusLabel widgets, the Python
+memory (as traced by tracemalloc) held by each StatusLabel, and the cost
+of common StatusLabel operations.  Run this against two revisions of
+mmtk to compare them.
+
+Usage: python benchmarks/bench_status_label.py [count]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mmtk import StatusLabel
+
+
+def count_widgets(widget):
+    """Returns the number of widgets in the tree rooted at widget"""
+    return sum(1 + count_widgets(w) for w in widget.winfo_children())
+
+
+def bench_construction(root, count=1000):
+    """Constructs count StatusLabels in a fresh frame.
+
+    Returns (tuple):
+        - construction time per instance (seconds)
+        - number of widgets created (including any leaked helpers)
+    """
+    frame = tk.Frame(root)
+    before = count_widgets(root)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        StatusLabel(frame)
+    elapsed = time.perf_counter() - start
+
+    after = count_widgets(root)
+    frame.destroy()
+
+    return elapsed / count, after - before - 1
+
+
+def bench_memory(root, count=10000, **kwargs):
+    """Constructs count StatusLabels with the specified options (or, if a
+    prototype StatusLabel is given, from that prototype) in a fresh frame.
+
+    Returns (tuple):
+        - construction time per instance (seconds)
+        - Python memory per instance (bytes, as traced by tracemalloc)
+    """
+    prototype = kwargs.pop("prototype", None)
+    frame = tk.Frame(root)
+    labels = []
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    if prototype is None:
+        for _ in range(count):
+            labels.append(StatusLabel(frame, **kwargs))
+    else:
+        for _ in range(count):
+            labels.append(StatusLabel.from_prototype(frame, prototype, **kwargs))
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    frame.destroy()
+    return elapsed / count, (after - before) / count
+
+
+def bench_state_flips(root, count=10000):
+    """Cycles a StatusLabel through all of its states.
+    Returns the mean time per state change."""
+    label = StatusLabel(root)
+    methods = (label.info, label.warning, label.error, label.clear)
+    start = time.perf_counter()
+    for i in range(count):
+        methods[i % 4](f"message {i}")
+    elapsed = time.perf_counter() - start
+    label.destroy()
+    return elapsed / count
+
+
+RESTYLE = (
+    ("background", "#eee"), ("foreground", "black"), ("relief", "flat"),
+    ("borderwidth", 1), ("padx", 2), ("pady", 2), ("anchor", "w"),
+    ("infobg", "#def"), ("infofg", "navy"), ("inforelief", "groove"),
+    ("warningbg", "#fc8"), ("warningfg", "black"), ("warningrelief", "ridge"),
+    ("errorbg", "#f00"), ("errorfg", "white"), ("errorrelief", "sunken"),
+    ("infobd", 2), ("warningbd", 2), ("errorbd", 2), ("cursor", "arrow"),
+)
+
+def bench_restyle(root, count=1000, batch=True):
+    """Applies 20 option changes (one configure call per option) to a
+    StatusLabel in the info state, either within a batch block or not.
+    Returns the mean time per restyle."""
+    label = StatusLabel(root)
+    label.info("restyle")
+    # alternate between two styles so that every restyle changes the label
+    restyles = (RESTYLE, tuple(
+        (key, "#123" if key.endswith(("bg", "background")) else value)
+        for key, value in RESTYLE
+    ))
+    start = time.perf_counter()
+    for i in range(count):
+        options = restyles[i % 2]
+        if batch:
+            with label.batch():
+                for key, value in options:
+                    label[key] = value
+        else:
+            for key, value in options:
+                label[key] = value
+    elapsed = time.perf_counter() - start
+    label.destroy()
+    return elapsed / count
+
+
+def bench_configure_dump(root, count=1000):
+    """Returns the mean time of a full StatusLabel.configure() dump"""
+    label = StatusLabel(root)
+    start = time.perf_counter()
+    for i in range(count):
+        label.configure()
+    elapsed = time.perf_counter() - start
+    label.destroy()
+    return elapsed / count
+
+
+def bench_cget(root, count=10000):
+    """Returns the mean time of StatusLabel.cget"""
+    keys = ("background", "infofg", "warning_relief", "errorfont", "padx")
+    label = StatusLabel(root)
+    start = time.perf_counter()
+    for i in range(count):
+        label.cget(keys[i % len(keys)])
+    elapsed = time.perf_counter() - start
+    label.destroy()
+    return elapsed / count
+
+
+def main(count=1000):
+    root = tk.Tk()
+    root.withdraw()
+
+    per_instance, widgets = bench_construction(root, count)
+    print(f"StatusLabels constructed: {count}")
+    print(f"construction time:        {1e6*per_instance:.1f} us/label")
+    print(f"widgets created:          {widgets} ({widgets/count:.2f} per label)")
+
+    overrides = {"infobg": "green", "relief": "ridge", "errorbold": False}
+    prototype = StatusLabel(root, **overrides)
+    for name, kwargs in (
+        ("defaults", {}),
+        ("3 overrides", overrides),
+        ("from prototype", {"prototype": prototype}),
+    ):
+        per, size = bench_memory(root, 10*count, **kwargs)
+        print(f"{10*count} labels, {name+':':15s} "
+              f"{1e6*per:.1f} us/label, {size:.0f} bytes/label")
+    prototype.destroy()
+
+    print(f"state change:             {1e6*bench_state_flips(root):.1f} us")
+    print(f"restyle (20 options):     {1e6*bench_restyle(root, batch=False):.1f} us")
+    print(f"restyle in batch:         {1e6*bench_restyle(root):.1f} us")
+    print(f"configure() dump:         {1e6*bench_configure_dump(root):.1f} us")
+    print(f"cget:                     {1e6*bench_cget(root):.1f} us")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,81 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""StatusPalette restyling benchmark
+
+Restyles a dashboard of StatusLabels (in a mix of states) back and
+forth between two palettes, comparing StatusPalette.apply with calling
+configure on each label.
+
+Usage: python benchmarks/bench_status_palette.py [count]
+"""
+
+import os
+import sys
+import time
+
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mmtk import StatusLabel, StatusPalette
+
+
+def make_labels(root, count=2000):
+    """Creates count StatusLabels, cycling through the status states"""
+    labels = []
+    for i in range(count):
+        label = StatusLabel(root)
+        (label.clear, label.info, label.warning, label.error)[i % 4](f"{i}")
+        labels.append(label)
+    return labels
+
+
+def configure_kwargs(palette):
+    """Returns the palette's values as StatusLabel configure kwargs"""
+    return {
+        (state or "") + option: value
+        for option, state, value in palette.updates
+    }
+
+
+def bench_palette(labels, repeat=10):
+    """Returns the mean time to restyle all labels with StatusPalette.apply"""
+    palettes = (StatusPalette.named("night"), StatusPalette.named("default"))
+    start = time.perf_counter()
+    for i in range(repeat):
+        palettes[i % 2].apply(labels)
+    return (time.perf_counter() - start) / repeat
+
+
+def bench_configure(labels, repeat=10):
+    """Returns the mean time to restyle all labels by calling configure
+    on each label"""
+    styles = [
+        configure_kwargs(StatusPalette.named(name))
+        for name in ("night", "default")
+    ]
+    start = time.perf_counter()
+    for i in range(repeat):
+        style = styles[i % 2]
+        for label in labels:
+            label.configure(**style)
+    return (time.perf_counter() - start) / repeat
+
+
+def main(count=2000):
+    root = tk.Tk()
+    root.withdraw()
+    frame = tk.Frame(root)
+    labels = make_labels(frame, count)
+
+    print(f"restyling {count} StatusLabels")
+    print(f"configure per label:      {1e3*bench_configure(labels):.2f} ms")
+    print(f"StatusPalette.apply:      {1e3*bench_palette(labels):.2f} ms")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,275 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""mmtk benchmark suite
+
+Runs all of the mmtk benchmarks and writes the results as JSON.  The
+results may be saved as the baseline for future runs or compared
+against a stored baseline, flagging any benchmark that has slowed down
+by more than a configurable threshold.
+
+The benchmarks need a display.  On a headless machine, run them under
+Xvfb, e.g.
+
+    xvfb-run -a python benchmarks/suite.py --compare
+
+Usage: python benchmarks/suite.py [options]   (see --help)
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import mmtk
+import bench_import
+import bench_message_queue
+import bench_options
+import bench_placeholder_entry
+import bench_scheduler
+import bench_status_label
+import bench_status_palette
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# name -> benchmark function
+#   Each benchmark function takes the root window and returns the time
+#   (in seconds) per operation, i.e. lower is better.
+BENCHMARKS = dict()
+
+def benchmark(name):
+    """Decorator which adds a function to the benchmark suite"""
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+@benchmark("status_label.construct")
+def status_label_construct(root):
+    return bench_status_label.bench_construction(root, 1000)[0]
+
+@benchmark("status_label.from_prototype")
+def status_label_from_prototype(root):
+    prototype = bench_status_label.StatusLabel(root, infobg="green")
+    result = bench_status_label.bench_memory(root, 10000, prototype=prototype)
+    prototype.destroy()
+    return result[0]
+
+@benchmark("status_label.state_flip")
+def status_label_state_flip(root):
+    return bench_status_label.bench_state_flips(root, 10000)
+
+@benchmark("status_label.configure_dump")
+def status_label_configure_dump(root):
+    return bench_status_label.bench_configure_dump(root, 1000)
+
+@benchmark("status_label.batch_restyle")
+def status_label_batch_restyle(root):
+    return bench_status_label.bench_restyle(root, 1000)
+
+@benchmark("status_label.cget")
+def status_label_cget(root):
+    return bench_status_label.bench_cget(root, 10000)
+
+@benchmark("status_label.queue_flood")
+def status_label_queue_flood(root):
+    return bench_message_queue.bench_flood(root, 100000, 1000)
+
+@benchmark("status_palette.apply_2k")
+def status_palette_apply(root):
+    frame = tk.Frame(root)
+    labels = bench_status_palette.make_labels(frame, 2000)
+    result = bench_status_palette.bench_palette(labels)
+    frame.destroy()
+    return result
+
+@benchmark("scheduler.schedule_cancel")
+def scheduler_schedule_cancel(root):
+    return bench_scheduler.bench_wheel(root, 10000)
+
+@benchmark("options.kwargs_rebuild")
+def options_kwargs_rebuild(root):
+    options = bench_options.Options(infobg="green")
+    return bench_options.bench_lookup(
+        lambda: (options._invalidate(2), options.kwargs("warning")), 10000)
+
+@benchmark("placeholder_entry.construct")
+def placeholder_entry_construct(root):
+    frame = ttk.Frame(root)
+    _,per_entry = bench_placeholder_entry.bench_construction(frame, 1000)
+    frame.destroy()
+    return per_entry
+
+@benchmark("placeholder_entry.focus_storm")
+def placeholder_entry_focus_storm(root):
+    frame = ttk.Frame(root)
+    entries,_ = bench_placeholder_entry.bench_construction(frame, 1000)
+    result = bench_placeholder_entry.bench_focus_storm(entries)
+    frame.destroy()
+    return result
+
+@benchmark("placeholder_entry.focus_storm_overlay")
+def placeholder_entry_focus_storm_overlay(root):
+    frame = ttk.Frame(root)
+    entries,_ = bench_placeholder_entry.bench_construction(
+        frame, 1000, placeholder_mode="overlay")
+    result = bench_placeholder_entry.bench_focus_storm(entries)
+    frame.destroy()
+    return result
+
+@benchmark("placeholder_entry.read_values")
+def placeholder_entry_read_values(root):
+    frame = ttk.Frame(root)
+    entries,_ = bench_placeholder_entry.bench_construction(frame, 1000)
+    result,_ = bench_placeholder_entry.bench_read_values(entries)
+    frame.destroy()
+    return result
+
+@benchmark("placeholder_entry.theme_switch")
+def placeholder_entry_theme_switch(root):
+    frame = ttk.Frame(root)
+    bench_placeholder_entry.bench_construction(frame, 1000)
+    style = ttk.Style(root)
+    original = style.theme_use()
+    themes = [t for t in ("clam", "alt", "default") if t in style.theme_names()]
+    result = bench_placeholder_entry.bench_theme_switch(root, themes)
+    style.theme_use(original)
+    frame.destroy()
+    return result
+
+@benchmark("import.mmtk")
+def import_mmtk(root):
+    return bench_import.bench_import(5)
+
+@benchmark("import.status_label")
+def import_status_label(root):
+    return bench_import.bench_first_access("StatusLabel", 5)
+
+
+def run(names, repeat):
+    """Runs the named benchmarks, each in a fresh Tk interpreter.
+    Returns {name: median seconds per operation}"""
+    results = dict()
+    for name in names:
+        samples = []
+        for _ in range(repeat):
+            root = tk.Tk()
+            root.withdraw()
+            samples.append(BENCHMARKS[name](root))
+            root.destroy()
+        results[name] = statistics.median(samples)
+        print(f"{name:35s} {1e6*results[name]:12.2f} us/op", flush=True)
+    return results
+
+
+def metadata():
+    """Describes the environment in which the benchmarks ran"""
+    root = tk.Tcl()
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "mmtk": mmtk.version,
+        "python": platform.python_version(),
+        "tk": root.eval("info patchlevel"),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Compares results against the baseline results.
+    Returns the list of benchmarks which regressed beyond the threshold."""
+    regressions = []
+    print()
+    print(f"{'benchmark':35s} {'baseline':>12s} {'current':>12s} {'change':>8s}")
+    for name,value in results.items():
+        try:
+            reference = baseline[name]
+        except KeyError:
+            print(f"{name:35s} {'-':>12s} {1e6*value:12.2f}      new")
+            continue
+        change = value/reference - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:35s} {1e6*reference:12.2f} {1e6*value:12.2f} "
+            f"{100*change:+7.1f}%{flag}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="mmtk benchmark suite")
+    parser.add_argument(
+        "-o", "--output", metavar="FILE",
+        help="write the results as JSON to FILE",
+    )
+    parser.add_argument(
+        "-k", "--filter", metavar="TEXT", default="",
+        help="only run benchmarks whose name contains TEXT",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3,
+        help="number of times to run each benchmark (the median is kept)",
+    )
+    parser.add_argument(
+        "--save-baseline", nargs="?", const=DEFAULT_BASELINE, metavar="FILE",
+        help="save the results as the baseline (default: %(const)s)",
+    )
+    parser.add_argument(
+        "--compare", nargs="?", const=DEFAULT_BASELINE, metavar="FILE",
+        help="compare the results with a baseline (default: %(const)s)",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="relative slowdown flagged as a regression (default: 0.10)",
+    )
+    parser.add_argument(
+        "--list", action="store_true",
+        help="list the benchmarks and exit",
+    )
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    try:
+        tk.Tk().destroy()
+    except tk.TclError as e:
+        print(f"Cannot open a display ({e}). Try running under xvfb-run.")
+        return 2
+
+    report = {"metadata": metadata(), "results": run(names, args.repeat)}
+
+    for filename in (args.output, args.save_baseline):
+        if filename:
+            with open(filename, "w") as f:
+                json.dump(report, f, indent=2, sort_keys=True)
+                f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(report["results"], baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {100*args.threshold:.0f}%")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
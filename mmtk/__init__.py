@@ -4,5 +4,32 @@
 
 from .__version__ import __version__ as version
 
-from .placeholder_entry import PlaceholderEntry
-from .status_label import StatusLabel
+# The widget modules (and tkinter along with them) are only imported
+# when one of their classes is first accessed, keeping `import mmtk`
+# cheap for applications that only need it on some code paths.
+
+# public name -> submodule defining it
+_lazy = {
+    "PlaceholderEntry": "placeholder_entry",
+    "StatusLabel": "status_label",
+    "StatusChannel": "status_channel",
+    "StatusHistory": "status_history",
+    "StatusPalette": "status_palette",
+}
+
+__all__ = ["version", *_lazy]
+
+
+def __getattr__(name):
+    try:
+        module = _lazy[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy})
@@ -0,0 +1,232 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""asyncio integration for mmtk widgets
+
+- TkDriver processes Tk events from within a running asyncio event loop
+- flash shows a status message on a StatusLabel for a limited time
+- entry_changes iterates asynchronously over the values of an entry
+
+Typical use:
+
+    async def main():
+        root = tk.Tk()
+        ...
+        await TkDriver(root).run()
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import _tkinter
+import tkinter as tk
+import weakref
+
+# root window -> TkDriver
+_drivers = weakref.WeakKeyDictionary()
+
+def _unbind(widget,sequence,funcid):
+    """Removes a single binding added with bind(..., add="+").
+    (Misc.unbind removes all of the bindings for the sequence)"""
+    script = widget.bind(sequence)
+    script = "\n".join(
+        line for line in script.split("\n") if funcid not in line
+    )
+    widget.tk.call("bind",widget._w,sequence,script)
+    widget.deletecommand(funcid)
+
+def wake(widget):
+    """Asks the TkDriver (if any) for the widget's interpreter to process
+    Tk events as soon as possible (e.g. to redraw a modified widget)."""
+    try:
+        driver = _drivers[widget._root()]
+    except KeyError:
+        return
+    driver.wake()
+
+
+class TkDriver:
+    """Runs the Tk event loop cooperatively inside an asyncio event loop.
+
+    Each pass of the driver processes the pending Tk events without
+    blocking and then sleeps.  The sleep starts at min_interval after any
+    Tk activity and doubles on each idle pass up to max_interval, so an
+    idle application costs very little CPU.  Code running in asyncio
+    tasks can cut the sleep short by calling `wake` (as the helpers in
+    this module do after modifying a widget).
+
+    This is still polling: events which originate in Tk (keyboard, mouse,
+    expose, `after` timers) are not seen until the current sleep ends, so
+    while the application is idle they can wait up to max_interval.  A
+    smaller max_interval cuts that latency at the cost of more idle CPU
+    (see benchmarks/bench_aio.py).
+    """
+
+    _flags = _tkinter.ALL_EVENTS | _tkinter.DONT_WAIT
+
+    # maximum number of Tk events processed per pass
+    max_events = 1000
+
+    def __init__(self,root,*,min_interval=0.002,max_interval=0.05):
+        """TkDriver constructor
+
+        Args:
+            root (tk.Tk): the root window whose events are to be processed
+            min_interval (float): seconds to sleep after Tk activity
+            max_interval (float): maximum seconds to sleep while idle
+        """
+        self.root = root
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._waiter = None
+        self._running = False
+
+    def wake(self):
+        """Ends the current sleep (if any) so that Tk events are processed"""
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def stop(self):
+        """Ends the run coroutine after its current pass"""
+        self._running = False
+        self.wake()
+
+    async def run(self):
+        """Processes Tk events until the root window is destroyed or
+        stop is called"""
+        loop = asyncio.get_running_loop()
+        root = self.root
+        dooneevent = root.tk.dooneevent
+
+        def on_destroy(event):
+            if event.widget is root:
+                self.stop()
+
+        bind_id = root.bind("<Destroy>",on_destroy,add="+")
+        _drivers[root] = self
+
+        self._running = True
+        interval = self.min_interval
+        try:
+            while self._running:
+                # process pending events, but not so many that the
+                # asyncio tasks are starved
+                busy = False
+                for _ in range(self.max_events):
+                    if not (self._running and dooneevent(self._flags)):
+                        break
+                    busy = True
+
+                if busy:
+                    interval = self.min_interval
+                else:
+                    interval = min(2*interval,self.max_interval)
+
+                self._waiter = loop.create_future()
+                timer = loop.call_later(interval,self.wake)
+                try:
+                    await self._waiter
+                finally:
+                    timer.cancel()
+                    self._waiter = None
+        finally:
+            self._running = False
+            if _drivers.get(root) is self:
+                del _drivers[root]
+            try:
+                _unbind(root,"<Destroy>",bind_id)
+            except tk.TclError:
+                pass
+
+
+async def flash(label,state,msg,seconds=3):
+    """Shows a status message on a StatusLabel for a limited time.
+
+    The label is cleared after the specified number of seconds unless
+    its status has been changed (or the label destroyed) in the meantime.
+
+    Args:
+        label (StatusLabel): the label on which to show the message
+        state (str): info, warning, or error
+        msg (str): the text to show
+        seconds (float): how long to show the message
+    """
+    getattr(label,state)(msg)
+    wake(label)
+    await asyncio.sleep(seconds)
+    try:
+        if label.state == state and label.cget("text") == msg:
+            label.clear()
+            wake(label)
+    except tk.TclError:
+        # the label (or its window) was destroyed in the meantime
+        pass
+
+
+def _entry_value(entry):
+    """Returns the entry's value (which is empty while a placeholder shows)"""
+    try:
+        return entry.value
+    except AttributeError:
+        return entry.get()
+
+
+async def entry_changes(entry):
+    """Asynchronously iterates over the values of an entry widget.
+
+    A value is yielded each time the entry's value changes.  For a
+    PlaceholderEntry, the placeholder text is never yielded (the value
+    is empty while the placeholder is showing).  Iteration ends when the
+    entry is destroyed.
+
+    Args:
+        entry (ttk.Entry or tk.Entry): the entry to watch
+    """
+    queue = asyncio.Queue()
+    last = _entry_value(entry)
+
+    def changed(*args):
+        nonlocal last
+        value = _entry_value(entry)
+        if value != last:
+            last = value
+            queue.put_nowait(value)
+
+    def destroyed(event):
+        if event.widget is entry:
+            queue.put_nowait(None)
+
+    if hasattr(entry,"add_change_callback"):
+        # a PlaceholderEntry already traces its value
+        entry.add_change_callback(changed)
+        trace = None
+    else:
+        name = str(entry["textvariable"])
+        if not name:
+            # the entry needs a textvariable to trace... keep it alive with
+            # the entry and keep the entry's current contents
+            entry._aio_variable = tk.StringVar(entry,value=entry.get())
+            entry["textvariable"] = entry._aio_variable
+            name = str(entry._aio_variable)
+        trace = entry.register(changed)
+        entry.tk.call("trace","add","variable",name,"write",trace)
+    bind_id = entry.bind("<Destroy>",destroyed,add="+")
+
+    try:
+        while True:
+            value = await queue.get()
+            if value is None:
+                return
+            yield value
+    finally:
+        try:
+            if trace is None:
+                entry.remove_change_callback(changed)
+            else:
+                entry.tk.call(
+                    "trace","remove","variable",name,"write",trace)
+                entry.deletecommand(trace)
+            _unbind(entry,"<Destroy>",bind_id)
+        except tk.TclError:
+            pass
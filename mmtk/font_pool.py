@@ -0,0 +1,72 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import tkinter as tk
+from tkinter.font import Font
+
+import weakref
+
+class FontPool:
+    """Reference counted collection of named Tk fonts.
+
+    Every call to tkinter.font.Font creates a new named font in the Tk
+    interpreter.  Widgets which derive fonts on the fly (e.g. an italic
+    version of some base font) can use a FontPool so that all requests
+    for the same font share a single named Tk font.
+
+    Fonts are pooled per Tk interpreter (identified by its root window)
+    using a key supplied by the caller.  Each call to `acquire` must be
+    balanced by a call to `release`.  Once a font is no longer referenced
+    by any widget, it is dropped from the pool (at which point tkinter
+    deletes the named font when the last Python reference goes away).
+    """
+
+    def __init__(self):
+        # root -> {key: [font, refcount]}
+        self._fonts = weakref.WeakKeyDictionary()
+        # root -> {font name: key}
+        self._keys = weakref.WeakKeyDictionary()
+
+    def acquire(self,key,attrs,root=None):
+        """Returns the pooled font for the specified key
+
+        Args:
+            key (hashable): identifies the font within the pool
+            attrs (dict): font attributes used to create the font if
+                it is not already in the pool
+            root (widget): root window of the Tk interpreter in which the
+                font is to be used (defaults to the default root)
+        Returns: tkinter.font.Font
+        """
+        root = root or tk._get_default_root()
+        fonts = self._fonts.setdefault(root,dict())
+        try:
+            entry = fonts[key]
+        except KeyError:
+            entry = fonts[key] = [Font(root,**attrs),0]
+            self._keys.setdefault(root,dict())[entry[0].name] = key
+        entry[1] += 1
+        return entry[0]
+
+    def release(self,font,root=None):
+        """Releases a font previously returned by `acquire`
+
+        Args:
+            font (tkinter.font.Font): the font being released
+            root (widget): root window of the Tk interpreter in which the
+                font is used (defaults to the default root)
+        Raises: KeyError if the font is not in the pool
+        """
+        root = root or tk._get_default_root()
+        key = self._keys[root][font.name]
+        entry = self._fonts[root][key]
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._fonts[root][key]
+            del self._keys[root][font.name]
+
+    def count(self,root=None):
+        """Returns the number of fonts currently in the pool"""
+        root = root or tk._get_default_root()
+        return len(self._fonts.get(root,()))
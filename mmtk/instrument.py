@@ -0,0 +1,268 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""Tcl round-trip accounting for mmtk widgets
+
+Most of the cost of an mmtk widget lies in its calls into the Tcl
+interpreter, which Python profilers do not break down.  When enabled,
+this module wraps the public (and key internal) methods of the mmtk
+widget classes and routes each widget's Tcl calls through a counter.
+For every widget and method it then accumulates:
+
+- calls: number of calls to the method
+- time: seconds spent in the method (including nested methods)
+- tcl_calls: number of Tcl calls made by the method
+- tcl_time: seconds spent in those Tcl calls
+
+Tcl calls are attributed to the innermost instrumented method running
+at the time.  Tcl calls made by a widget outside of any instrumented
+method (e.g. geometry management) are attributed to the method name
+"<other>".
+
+The Tcl calls of the helpers shared by mmtk widgets (e.g. the registry
+of placeholder styles) are counted too.  They are attributed to the
+widget method using the helper, or else to "<other>" under the name of
+the helper class (e.g. "<PlaceholderStyles>").
+
+Typical use:
+
+    from mmtk import instrument
+
+    with instrument.recording() as rec:
+        ...
+    for widget,methods in rec.stats().items():
+        ...
+
+Instrumentation is meant for the Tk thread only and adds overhead of
+its own; it is off unless explicitly enabled.
+"""
+
+import weakref
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+from .placeholder_entry import PlaceholderEntry, PlaceholderStyles
+from .status_label import StatusLabel
+
+# instrumented methods for each mmtk widget class
+#   the first name in each tuple is the name used in the statistics
+_methods = {
+    StatusLabel: (
+        ("info",), ("warning",), ("error",), ("clear",), ("post",),
+        ("configure","config"), ("cget",), ("__getitem__",),
+        ("__setitem__",), ("destroy",), ("_set_state",), ("_refresh",),
+        ("_flash",),
+    ),
+    PlaceholderEntry: (
+        ("_handle_focus_in",), ("_handle_focus_out",),
+        ("_show_placeholder",), ("_hide_placeholder",),
+        ("_handle_theme_changed",), ("_handle_destroy",),
+        ("_handle_variable_write",), ("_update_overlay",),
+        ("add_change_callback",), ("remove_change_callback",),
+        ("configure","config"), ("cget",), ("get",), ("insert",),
+        ("delete",), ("destroy",),
+    ),
+}
+
+# helpers whose Tcl calls are counted, but whose methods are not recorded
+#   (the calls are attributed to the instrumented method using the helper)
+_helpers = {
+    PlaceholderStyles: (
+        "current_theme", "default_color", "field", "acquire", "refresh",
+    ),
+}
+
+_enabled = False
+_originals = list()   # (class, attribute name, original or None)
+_widgets = weakref.WeakSet()  # widgets whose Tcl calls are being counted
+_stack = list()       # frames of the instrumented methods being run
+_stats = dict()       # widget path -> method -> [calls, time, tcl calls, tcl time]
+
+
+def _counted(name):
+    """Returns a _TclCounter method which counts calls to the named
+    method of the Tcl interpreter"""
+    def method(self,*args):
+        start = perf_counter()
+        try:
+            return getattr(self._tk,name)(*args)
+        finally:
+            elapsed = perf_counter() - start
+            if _stack:
+                record = _stack[-1]
+            else:
+                record = _record(self._widget,"<other>")
+            record[2] += 1
+            record[3] += elapsed
+    method.__name__ = name
+    return method
+
+
+class _TclCounter:
+    """Stands in for a widget's Tcl interpreter, attributing each call
+    to the innermost instrumented method (or to the widget)"""
+    def __init__(self,tk,widget):
+        self._tk = tk
+        self._widget = widget
+
+    def __getattr__(self,name):
+        return getattr(self._tk,name)
+
+# the interpreter methods which go through Tcl
+for _name in (
+    "call", "eval", "getvar", "setvar", "unsetvar", "globalgetvar",
+    "globalsetvar", "globalunsetvar", "splitlist", "getboolean",
+    "getint", "getdouble", "exprstring", "exprboolean", "exprlong",
+    "exprdouble",
+):
+    setattr(_TclCounter,_name,_counted(_name))
+del _name
+
+
+def _record(widget,method):
+    """Returns the statistics record for a widget method"""
+    methods = _stats.setdefault(widget,dict())
+    try:
+        return methods[method]
+    except KeyError:
+        record = methods[method] = [0,0.0,0,0.0]
+        return record
+
+
+def _count_tcl_calls(widget,name=None):
+    """Routes the widget's (or helper's) Tcl calls through a counter,
+    recording any calls made outside of instrumented methods under the
+    specified name (default: the widget path)"""
+    tk = widget.__dict__.get("tk")
+    if tk is None:
+        return
+    name = name or str(widget)
+    if isinstance(tk,_TclCounter):
+        if tk._widget == name:
+            return
+        # inherited from an instrumented parent
+        tk = tk._tk
+    widget.tk = _TclCounter(tk,name)
+    _widgets.add(widget)
+
+
+def _instrument(method,name):
+    """Returns an instrumented version of an mmtk widget method"""
+    @wraps(method)
+    def wrapper(self,*args,**kwargs):
+        _count_tcl_calls(self)
+        record = _record(str(self),name)
+        _stack.append(record)
+        start = perf_counter()
+        try:
+            return method(self,*args,**kwargs)
+        finally:
+            record[0] += 1
+            record[1] += perf_counter() - start
+            _stack.pop()
+    return wrapper
+
+
+def _instrument_helper(method):
+    """Returns a version of a helper method whose Tcl calls are counted"""
+    @wraps(method)
+    def wrapper(self,*args,**kwargs):
+        _count_tcl_calls(self,f"<{type(self).__name__}>")
+        return method(self,*args,**kwargs)
+    return wrapper
+
+
+def enable():
+    """Starts instrumenting all mmtk widgets"""
+    global _enabled
+    if _enabled:
+        return
+    for cls,methods in _methods.items():
+        for names in methods:
+            for attr in names:
+                method = getattr(cls,attr,None)
+                if method is None:
+                    continue
+                _originals.append((cls,attr,cls.__dict__.get(attr)))
+                setattr(cls,attr,_instrument(method,names[0]))
+    for cls,attrs in _helpers.items():
+        for attr in attrs:
+            _originals.append((cls,attr,cls.__dict__.get(attr)))
+            setattr(cls,attr,_instrument_helper(getattr(cls,attr)))
+    _enabled = True
+
+
+def disable():
+    """Stops instrumenting mmtk widgets (the statistics are kept)"""
+    global _enabled
+    if not _enabled:
+        return
+    while _originals:
+        cls,attr,original = _originals.pop()
+        if original is None:
+            delattr(cls,attr)
+        else:
+            setattr(cls,attr,original)
+    for widget in list(_widgets):
+        widget.tk = widget.tk._tk
+    _widgets.clear()
+    _enabled = False
+
+
+def is_enabled():
+    """Returns True if mmtk widgets are currently being instrumented"""
+    return _enabled
+
+
+def reset():
+    """Discards all of the statistics gathered so far"""
+    _stats.clear()
+
+
+def stats():
+    """Returns the statistics gathered so far
+
+    Returns (dict): widget path -> method name -> dict with keys
+        calls, time, tcl_calls, and tcl_time
+    """
+    keys = ("calls","time","tcl_calls","tcl_time")
+    return {
+        widget: {
+            method: dict(zip(keys,record))
+            for method,record in methods.items()
+        }
+        for widget,methods in _stats.items()
+    }
+
+
+class Recording:
+    """Result of the recording context manager"""
+    def __init__(self):
+        self._stats = None
+
+    def stats(self):
+        """Returns the statistics gathered during the recording
+        (see the module level stats function)"""
+        return stats() if self._stats is None else self._stats
+
+
+@contextmanager
+def recording():
+    """Context manager which gathers statistics for the enclosed block.
+    Instrumentation is enabled for the block (if not already enabled)
+    and any previously gathered statistics are discarded.
+
+    Yields: Recording
+    """
+    was_enabled = _enabled
+    enable()
+    reset()
+    result = Recording()
+    try:
+        yield result
+    finally:
+        result._stats = stats()
+        if not was_enabled:
+            disable()
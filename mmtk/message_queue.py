@@ -0,0 +1,157 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+from heapq import heapify, heappop, heappush
+from itertools import count
+from time import monotonic
+
+from .scheduler import scheduler
+from .status_label import OptionError, _state_index
+
+class MessageQueue:
+    """Priority queue of the status messages waiting to be shown on a
+    StatusLabel (see the StatusLabel min_display option).
+
+    Each message is shown for at least the minimum display time of its
+    state, unless a message of higher severity (error > warning > info >
+    cleared) arrives, which is shown at once.  Other messages wait in the
+    queue and are shown in order of severity.  Only the most recent
+    message of each severity waits: a new message replaces any pending
+    message of the same severity, which would be out of date by the time
+    it is shown.
+
+    The queue holds at most maxlen messages.  When it is full, the least
+    severe message is dropped, which may be the new message itself.
+
+    The pending messages are kept in two heaps (best first and worst
+    first) with lazy deletion, so each message costs O(log n) however
+    fast messages are posted.  The display timing uses the shared mmtk
+    scheduler.
+    """
+
+    # index of each field of a queued message entry
+    _SEVERITY, _SEQ, _STATE, _MSG, _ALIVE = range(5)
+
+    def __init__(self,label,min_display,maxlen=100):
+        """MessageQueue constructor
+
+        Args:
+            label (StatusLabel): the label on which the messages are shown
+            min_display (dict): minimum display time (seconds) keyed by
+                state (None for cleared).  Missing states default to 0.
+            maxlen (int): maximum number of queued messages
+        Raises: OptionError if an invalid state is specified
+        """
+        for state in min_display:
+            if state not in _state_index:
+                raise OptionError(f"Invalid state: {state}")
+        if maxlen < 1:
+            raise ValueError(f"MessageQueue maxlen must be positive: {maxlen}")
+
+        self.label = label
+        self.min_display = dict.fromkeys(_state_index,0)
+        self.min_display.update(min_display)
+        self.maxlen = maxlen
+
+        self._best = []     # (-severity, seq, entry): next message to show
+        self._worst = []    # (severity, -seq, entry): next message to drop
+        self._count = 0     # number of live entries
+        self._pending = {}  # severity -> live entry
+        self._seq = count()
+
+        self._severity = 0  # severity of the message currently shown
+        self._until = 0.0   # monotonic time until which it must be shown
+        self._timer = None
+
+        self.dropped = 0
+
+    def __len__(self):
+        return self._count
+
+    def post(self,state,msg):
+        """Queues a message, showing it at once if possible"""
+        severity = _state_index[state]
+        seq = next(self._seq)
+
+        stale = self._pending.pop(severity,None)
+        if stale is not None:
+            stale[self._ALIVE] = False
+            self._count -= 1
+            self.dropped += 1
+
+        if self._count >= self.maxlen:
+            worst = self._peek(self._worst)
+            if severity < worst[self._SEVERITY]:
+                self.dropped += 1
+                return
+            worst[self._ALIVE] = False
+            del self._pending[worst[self._SEVERITY]]
+            self._count -= 1
+            self.dropped += 1
+
+        entry = [severity,seq,state,msg,True]
+        self._pending[severity] = entry
+        heappush(self._best,(-severity,seq,entry))
+        heappush(self._worst,(severity,-seq,entry))
+        self._count += 1
+        self._compact()
+
+        self._release()
+
+    def close(self):
+        """Discards all queued messages and cancels the display timer"""
+        self._best.clear()
+        self._worst.clear()
+        self._pending.clear()
+        self._count = 0
+        if self._timer is not None:
+            self._timer.cancel()
+
+    def _peek(self,heap):
+        """Returns the top live entry of the specified heap"""
+        while not heap[0][-1][self._ALIVE]:
+            heappop(heap)
+        return heap[0][-1]
+
+    def _compact(self):
+        """Rebuilds the heaps without their dead entries once these
+        outnumber the live ones (amortized O(1) per message)"""
+        if len(self._best) + len(self._worst) > 4*self._count + 32:
+            self._best = [item for item in self._best if item[-1][self._ALIVE]]
+            self._worst = [item for item in self._worst if item[-1][self._ALIVE]]
+            heapify(self._best)
+            heapify(self._worst)
+
+    def _release(self):
+        """Shows the best queued message if the current message has been
+        shown long enough (or is less severe)"""
+        if not self._count:
+            return
+
+        now = monotonic()
+        entry = self._peek(self._best)
+        if now < self._until and entry[self._SEVERITY] <= self._severity:
+            if self._timer is None or not self._timer.pending:
+                self._schedule(self._until - now)
+            return
+
+        heappop(self._best)
+        entry[self._ALIVE] = False
+        del self._pending[entry[self._SEVERITY]]
+        self._count -= 1
+
+        state = entry[self._STATE]
+        self._severity = entry[self._SEVERITY]
+        self._until = now + self.min_display[state]
+        self.label._show_state(state,entry[self._MSG])
+
+        if self._count:
+            self._schedule(self.min_display[state])
+
+    def _schedule(self,delay):
+        """(Re)schedules the release of the next queued message"""
+        if self._timer is None:
+            self._timer = scheduler(self.label).schedule(delay,self._release)
+        else:
+            self._timer.reschedule(delay)
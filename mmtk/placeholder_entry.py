@@ -6,11 +6,189 @@ import tkinter as tk
 from tkinter import ttk
 from tkinter import font
 
+import sys
+import weakref
+
+from .font_pool import FontPool
+
+# placeholder fonts shared by all PlaceholderEntry widgets
+# keyed by (font attributes, italic)
+_placeholder_fonts = FontPool()
+
+class PlaceholderStyles:
+    """Registry of the ttk styles used to show placeholder text.
+
+    All PlaceholderEntry widgets (within a given Tk interpreter) which
+    use the same placeholder color share a single style.  Styles are
+    reference counted.  As ttk provides no means of deleting a style,
+    the name of a style which is no longer in use is recycled for the
+    next placeholder color that needs a style.
+
+    Entries which do not specify a placeholder color share the style
+    keyed by None, whose color is the default placeholder color for the
+    current theme.  The default colors are cached per theme.  As ttk
+    style settings are also per theme, all styles are updated once when
+    the theme changes (see `theme_changed`).
+
+    Entries using overlay mode need no style, but their overlays are
+    also updated by the refresh (see `add_overlay`).
+    """
+    def __init__(self,tk):
+        self.tk = tk
+        self.styles = dict()  # color -> [style name, refcount, (theme,color)]
+        self.unused = list()  # style names available for reuse
+        self.created = 0      # number of style names ever created
+        self.colors = dict()  # theme -> default placeholder color
+        self.fields = dict()  # theme -> (field background, text offset)
+        self.overlays = weakref.WeakSet()  # entries using overlay mode
+        self.refresh_pending = False
+
+    def current_theme(self):
+        """Returns the name of the current ttk theme"""
+        return self.tk.eval("return $ttk::currentTheme")
+
+    def default_color(self,theme=None):
+        """Returns the default placeholder color for the specified theme
+        (or the current theme).  This is a 2:1 mix of the TEntry foreground
+        and background colors."""
+        theme = theme or self.current_theme()
+        try:
+            return self.colors[theme]
+        except KeyError:
+            pass
+
+        def element_rgb(element):
+            color = self.tk.call("ttk::style","lookup","TEntry",f"-{element}")
+            rgb = self.tk.splitlist(self.tk.call("winfo","rgb",".",color))
+            return tuple(int(c)//256 for c in rgb)
+
+        fg = element_rgb('foreground')
+        bg = element_rgb('background')
+
+        color = '#' + ''.join(f"{(2*f+b)//3:02x}" for f,b in zip(fg,bg))
+        self.colors[theme] = color
+        return color
+
+    def field(self,theme=None):
+        """Returns (background,x) for the specified theme (or the current
+        theme), where background is the TEntry field background color and
+        x is the offset of the text from the left edge of an entry."""
+        theme = theme or self.current_theme()
+        try:
+            return self.fields[theme]
+        except KeyError:
+            pass
+
+        def lookup(option):
+            return self.tk.call("ttk::style","lookup","TEntry",f"-{option}")
+
+        background = str(lookup('fieldbackground')) or 'white'
+        x = 0
+        for option in ('borderwidth','padding'):
+            values = self.tk.splitlist(lookup(option))
+            if values:
+                x += self.tk.getint(self.tk.call("winfo","pixels",".",values[0]))
+        setting = self.fields[theme] = (background,x+1)
+        return setting
+
+    def add_overlay(self,entry):
+        """Registers an entry whose overlay is to be updated when the
+        theme changes"""
+        self.overlays.add(entry)
+
+    def remove_overlay(self,entry):
+        """Unregisters an entry added with add_overlay"""
+        self.overlays.discard(entry)
+
+    def acquire(self,color=None):
+        """Returns the name of the placeholder style for the specified color
+        (or for the default color if None)"""
+        try:
+            entry = self.styles[color]
+        except KeyError:
+            if self.unused:
+                name = self.unused.pop()
+            else:
+                name = f"Placeholder{self.created}.TEntry"
+                self.created += 1
+            entry = self.styles[color] = [name,0,None]
+            self._configure(entry,color,self.current_theme())
+        entry[1] += 1
+        return entry[0]
+
+    def release(self,color=None):
+        """Releases a reference to the placeholder style for the specified color"""
+        entry = self.styles[color]
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self.styles[color]
+            self.unused.append(entry[0])
+
+    def theme_changed(self,widget):
+        """Handles <<ThemeChanged>> (which ttk sends to every widget).
+        Schedules a single refresh of all styles no matter how many
+        entries receive the event."""
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            widget._root().after_idle(self.refresh)
+
+    def refresh(self):
+        """Recomputes the default color for the current theme and updates
+        the settings of any placeholder style which is out of date."""
+        self.refresh_pending = False
+        theme = self.current_theme()
+        self.colors.pop(theme,None)
+        self.fields.pop(theme,None)
+        for color,entry in self.styles.items():
+            self._configure(entry,color,theme)
+        for entry in list(self.overlays):
+            entry._configure_overlay(theme)
+
+    def _configure(self,entry,color,theme):
+        """Sets the style's foreground unless already set for the theme.
+        (configuring a style causes ttk to send <<ThemeChanged>> again)"""
+        setting = (theme, color or self.default_color(theme))
+        if entry[2] != setting:
+            self.tk.call("ttk::style","configure",entry[0],"-foreground",setting[1])
+            entry[2] = setting
+
+# root window -> PlaceholderStyles
+_placeholder_styles = weakref.WeakKeyDictionary()
+
+def placeholder_styles(widget):
+    """Returns the placeholder style registry for the widget's Tk interpreter"""
+    root = widget._root()
+    try:
+        return _placeholder_styles[root]
+    except KeyError:
+        styles = _placeholder_styles[root] = PlaceholderStyles(root.tk)
+        return styles
+
+
 class PlaceholderEntry (ttk.Entry):
     """Custom widget derived from ttk.Entry.  Provides "placeholder" text in an
     empty entry field when it is not in focus.
+
+    The placeholder can be rendered in either of two modes:
+
+    - "text": the placeholder is inserted into the entry itself, which is
+      switched to the placeholder font and style.  Each focus change
+      reconfigures the entry and replaces its contents.
+    - "overlay": the placeholder is a label placed over the empty entry.
+      Whether the entry is empty is tracked through a trace on its
+      textvariable, so a focus change never touches the entry's contents
+      or configuration; at most it shows or hides the overlay.  This mode
+      is much cheaper on forms with many entries.
+
+    In either mode, the entry's actual value (which is empty while the
+    placeholder is shown) is available from the `value` property, and
+    callbacks can be notified of its changes (see `add_change_callback`).
+    Both are fed by a trace on the entry's textvariable, which is created
+    if the entry does not have one.
     """
 
+    placeholder_modes = ("text","overlay")
+
     def __init__(
         self,
         parent,
@@ -19,6 +197,7 @@ class PlaceholderEntry (ttk.Entry):
         placeholder_font=None,
         placeholder_italic=True,
         placeholder_color=None,
+        placeholder_mode="text",
         **kwargs
     ):
         """
@@ -30,6 +209,7 @@ class PlaceholderEntry (ttk.Entry):
             placeholder_font (see below): Font to use for the placeholder text (optional)
             placeholder_italic (bool): Display placeholder text in italics (default=True)
             placeholder_color (str): Color to use for the placeholder text (optional)
+            placeholder_mode (str): "text" (default) or "overlay" (see above)
 
             - The placholder font can be any of the following:
               - a recognized font name
@@ -44,13 +224,19 @@ class PlaceholderEntry (ttk.Entry):
 
             All other args or kwargs are passed along to the ttk.Entry
             constructor.
+
+        Raises: ValueError if placeholder_mode is not recognized
         """
+        if placeholder_mode not in self.placeholder_modes:
+            raise ValueError(f"Invalid placeholder mode: {placeholder_mode}")
+        self.placeholder_mode = placeholder_mode
         self.placeholder_text = placeholder_text
         super().__init__(parent,*args,**kwargs)
 
         self.show = self['show']
 
         self.entry_font = font.nametofont(str(self['font']))
+        self._pooled_font = None
         if type(placeholder_font) is font.Font:
             self.placeholder_font = placeholder_font
         else:
@@ -59,48 +245,179 @@ class PlaceholderEntry (ttk.Entry):
                 placeholder_italic,
             )
 
-        if placeholder_color is None:
-            self.placeholder_color = self._determine_placeholder_color()
+        self._placeholder_color = placeholder_color
+        self._overlay = None
+        self._track_value()
+        if placeholder_mode == "overlay":
+            self._create_overlay()
         else:
-            self.placeholder_color = placeholder_color
-
-        self._create_placeholder_style()
-
-        self._show_placeholder()
+            self._create_placeholder_style()
+            self._show_placeholder()
 
         self.bind('<FocusIn>',self._handle_focus_in)
         self.bind('<FocusOut>',self._handle_focus_out)
+        self.bind('<<ThemeChanged>>',self._handle_theme_changed)
 
+    @property
+    def value(self):
+        """The entry's value ('' while the placeholder is shown).  This is
+        cached, so reading it makes no call into Tk."""
+        return self._value
 
-    def _determine_placeholder_color(self):
-        s = ttk.Style()
-        def element_rgb(element):
-            rgb = self.winfo_rgb(s.lookup('TEntry',element))
-            return tuple(c//256 for c in rgb)
+    def add_change_callback(self,callback):
+        """Registers callback(value) to be called each time the entry's
+        value changes.  Showing or hiding the placeholder is not a change."""
+        self._callbacks.append(callback)
 
-        fg = element_rgb('foreground')
-        bg = element_rgb('background')
+    def remove_change_callback(self,callback):
+        """Unregisters a callback added with add_change_callback"""
+        try:
+            self._callbacks.remove(callback)
+        except ValueError:
+            pass
 
-        return '#' + ''.join(f"{(2*f+b)//3:02x}" for f,b in zip(fg,bg))
+    @property
+    def placeholder_color(self):
+        """The placeholder color (the default color depends on the theme)"""
+        if self._placeholder_color is None:
+            return self._styles.default_color()
+        return self._placeholder_color
 
     def _determine_placeholder_font(self,placeholder_font,italic):
         if placeholder_font is None:
             font_attr = self.entry_font.actual()
             if italic:
                 font_attr['slant'] = 'italic'
-            return font.Font(**font_attr)
+            return self._acquire_font(font_attr,italic)
         elif type(placeholder_font) is str:
             return font.nametofont(placeholder_font)
         elif type(placeholder_font) is dict:
-            return font.Font(**placeholder_font)
+            return self._acquire_font(placeholder_font,False)
         else:
             # don't know how to handle it... let Tkinter deal with it.
-            return font
+            return placeholder_font
+
+    def _acquire_font(self,font_attr,italic):
+        """Returns the shared placeholder font with the specified attributes"""
+        key = (tuple(sorted(font_attr.items())),italic)
+        self._pooled_font = _placeholder_fonts.acquire(
+            key, font_attr, self._root()
+        )
+        return self._pooled_font
+
+    def _track_value(self):
+        """Traces the entry's textvariable (creating one if needed) to keep
+        the value cache up to date"""
+        self._callbacks = list()
+        self.showing_placeholder = False
+        self._variable_name = str(self['textvariable'])
+        if not self._variable_name:
+            # keep the variable alive with the entry
+            self._variable = tk.StringVar(self,value=self.get())
+            self['textvariable'] = self._variable
+            self._variable_name = str(self._variable)
+        self._value = str(self.getvar(self._variable_name))
+
+        self._trace = self.register(self._handle_variable_write)
+        self.tk.call(
+            "trace","add","variable",self._variable_name,"write",self._trace
+        )
+        self._style_acquired = False
+        self.bind('<Destroy>',self._handle_destroy,add='+')
 
     def _create_placeholder_style(self):
-        self.placeholder_style = f"{id(self)}.TEntry"
-        s = ttk.Style()
-        s.configure(self.placeholder_style, foreground=self.placeholder_color)
+        self._styles = placeholder_styles(self)
+        self.placeholder_style = self._styles.acquire(self._placeholder_color)
+        self._style_acquired = True
+
+    def _create_overlay(self):
+        self._styles = placeholder_styles(self)
+        self.placeholder_style = None
+        self._focused = False
+
+        self._overlay = tk.Label(
+            self,
+            text=self.placeholder_text,
+            font=self.placeholder_font,
+            borderwidth=0,
+            padx=0,
+            pady=0,
+            cursor='xterm',
+        )
+        self._overlay.bind('<Button-1>',self._handle_overlay_click)
+        self._styles.add_overlay(self)
+        self._configure_overlay()
+
+    def _configure_overlay(self,theme=None):
+        """Applies the placeholder color and field settings for the theme"""
+        background,self._overlay_x = self._styles.field(theme)
+        color = self._placeholder_color or self._styles.default_color(theme)
+        self._overlay.configure(foreground=color,background=background)
+        if self.showing_placeholder:
+            self._overlay.place(x=self._overlay_x,rely=0.5,anchor='w')
+        else:
+            self._update_overlay()
+
+    def _update_overlay(self):
+        """Shows the overlay if the entry is empty and not in focus (and
+        hides it otherwise).  Makes no Tk call if nothing changes."""
+        show = not self._value and not self._focused
+        if show == self.showing_placeholder:
+            return
+        self.showing_placeholder = show
+        if show:
+            self._overlay.place(x=self._overlay_x,rely=0.5,anchor='w')
+        else:
+            self._overlay.place_forget()
+
+    def _handle_variable_write(self,*args):
+        value = str(self.getvar(self._variable_name))
+        if (
+            self.showing_placeholder and self._overlay is None
+            and value in ('',self.placeholder_text)
+        ):
+            # the placeholder text is being shown in the entry itself
+            value = ''
+        if value == self._value:
+            return
+        self._value = value
+        if self._overlay is not None:
+            self._update_overlay()
+        for callback in list(self._callbacks):
+            try:
+                callback(value)
+            except Exception:
+                self.report_callback_exception(*sys.exc_info())
+
+    def _handle_overlay_click(self,event=None):
+        self.focus_set()
+        return 'break'
+
+    def _handle_destroy(self,event=None):
+        if event is not None and str(event.widget) != str(self):
+            return
+        if self._overlay is not None:
+            self._styles.remove_overlay(self)
+        if self._trace is not None:
+            self._callbacks.clear()
+            try:
+                self.tk.call(
+                    "trace","remove","variable",self._variable_name,"write",
+                    self._trace,
+                )
+            except tk.TclError:
+                pass
+            self.deletecommand(self._trace)
+            self._trace = None
+        if self._style_acquired:
+            self._styles.release(self._placeholder_color)
+            self._style_acquired = False
+        if self._pooled_font is not None:
+            _placeholder_fonts.release(self._pooled_font,self._root())
+            self._pooled_font = None
+
+    def _handle_theme_changed(self,event=None):
+        self._styles.theme_changed(self)
 
     def _show_placeholder(self):
         self.showing_placeholder = True
@@ -118,9 +435,15 @@ class PlaceholderEntry (ttk.Entry):
         self.delete(0,'end')
 
     def _handle_focus_in(self,event=None):
-        if self.showing_placeholder:
+        if self._overlay is not None:
+            self._focused = True
+            self._update_overlay()
+        elif self.showing_placeholder:
             self._hide_placeholder()
 
     def _handle_focus_out(self,event=None):
-        if not self.get():
+        if self._overlay is not None:
+            self._focused = False
+            self._update_overlay()
+        elif not self.get():
             self._show_placeholder()
@@ -0,0 +1,208 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+"""Timer wheel scheduler shared by all mmtk widgets
+
+Rather than each widget creating its own Tk timers (one `after` per
+label per message), time based effects such as auto-clearing a status
+message are scheduled on the TimerWheel of the widget's Tk interpreter.
+The wheel is driven by a single Tk `after` tick, which only runs while
+there are timers pending.
+
+Typical use:
+
+    timer = scheduler(widget).schedule(5, widget.clear)
+    ...
+    timer.cancel()
+"""
+
+import sys
+import tkinter as tk
+import weakref
+from math import ceil
+from time import monotonic
+
+class Timer:
+    """A callback scheduled on a TimerWheel (see TimerWheel.schedule)"""
+
+    __slots__ = ("wheel", "slot", "rounds", "callback", "args")
+
+    # slot value of a timer which is due and about to be called
+    _DUE = -1
+
+    def __init__(self,wheel,callback,args):
+        self.wheel = wheel
+        self.slot = None        # index of the wheel slot (None if not pending)
+        self.rounds = 0         # full turns of the wheel still to wait
+        self.callback = callback
+        self.args = args
+
+    @property
+    def pending(self):
+        """True if the timer is scheduled and has not yet been called"""
+        return self.slot is not None
+
+    def cancel(self):
+        """Cancels the timer (if pending)"""
+        self.wheel.cancel(self)
+
+    def reschedule(self,delay):
+        """Reschedules the timer to be called delay seconds from now"""
+        self.wheel.reschedule(self,delay)
+
+
+class TimerWheel:
+    """Hashed timer wheel driven by a single Tk after tick.
+
+    Timers are kept in a ring of slots, one per tick.  A timer due in
+    more ticks than there are slots simply waits for the wheel to turn
+    the required number of times.  Scheduling, cancelling, and
+    rescheduling a timer are all O(1); each tick only visits the timers
+    in the current slot.
+
+    Timers are never called early, but may be called up to one tick
+    late (or later if the Tk event loop is busy).
+
+    The wheel holds its master weakly, so that caching it per root
+    window (see `scheduler`) does not keep the root alive.
+    """
+
+    def __init__(self,master,*,tick=0.05,slots=256):
+        """TimerWheel constructor
+
+        Args:
+            master (widget): widget whose Tk interpreter drives the wheel
+            tick (float): resolution of the wheel (seconds)
+            slots (int): number of slots in the wheel
+        """
+        self._master = weakref.ref(master)
+        self.tick = tick
+        self._slots = [dict() for _ in range(slots)]  # ordered sets of Timers
+        self._position = 0      # index of the slot of the last tick
+        self._next_time = 0.0   # monotonic time of the next tick
+        self._count = 0         # number of pending timers
+        self._active = False    # True while the tick is running
+        self._after_id = None
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def master(self):
+        """The widget driving the wheel (None once it no longer exists)"""
+        return self._master()
+
+    def schedule(self,delay,callback,*args):
+        """Schedules callback(*args) to be called delay seconds from now
+
+        Returns: Timer
+        """
+        timer = Timer(self,callback,args)
+        self._insert(timer,delay)
+        return timer
+
+    def cancel(self,timer):
+        """Cancels the specified timer (if pending)"""
+        if timer.slot is None:
+            return
+        if timer.slot != Timer._DUE:
+            del self._slots[timer.slot][timer]
+            self._count -= 1
+        timer.slot = None
+
+    def reschedule(self,timer,delay):
+        """Reschedules the specified timer (pending or not) to be called
+        delay seconds from now"""
+        self.cancel(timer)
+        self._insert(timer,delay)
+
+    def _insert(self,timer,delay):
+        now = monotonic()
+        if not self._active:
+            self._next_time = now + self.tick
+            self._after_id = self.master.after(ceil(1000*self.tick),self._tick)
+            self._active = True
+
+        # the timer is called on the first tick at least delay from now
+        ticks = 1 + max(0,ceil((delay - (self._next_time - now))/self.tick))
+        slots = len(self._slots)
+        timer.slot = (self._position + ticks) % slots
+        timer.rounds = (ticks - 1) // slots
+        self._slots[timer.slot][timer] = None
+        self._count += 1
+
+    def _tick(self):
+        """Advances the wheel to the current time, calling all due timers"""
+        self._after_id = None
+        while self._count and self._next_time <= monotonic():
+            self._position = (self._position + 1) % len(self._slots)
+            self._next_time += self.tick
+            self._expire(self._slots[self._position])
+
+        if self._count:
+            delay = max(1,ceil(1000*(self._next_time - monotonic())))
+            self._after_id = self.master.after(delay,self._tick)
+        else:
+            self._active = False
+
+    def _expire(self,slot):
+        """Calls the timers in the specified slot which are due"""
+        due = []
+        for timer in list(slot):
+            if timer.rounds:
+                timer.rounds -= 1
+            else:
+                del slot[timer]
+                self._count -= 1
+                timer.slot = Timer._DUE
+                due.append(timer)
+
+        for timer in due:
+            # (a timer may be cancelled by an earlier callback)
+            if timer.slot != Timer._DUE:
+                continue
+            timer.slot = None
+            try:
+                timer.callback(*timer.args)
+            except Exception:
+                self.master.report_callback_exception(*sys.exc_info())
+
+    def stop(self):
+        """Cancels all pending timers"""
+        for slot in self._slots:
+            for timer in slot:
+                timer.slot = None
+            slot.clear()
+        self._count = 0
+        master = self.master
+        if self._after_id is not None and master is not None:
+            try:
+                master.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+        self._after_id = None
+        self._active = False
+
+    def _handle_destroy(self,event):
+        """Stops the wheel when its master is destroyed"""
+        if event.widget is self.master:
+            self.stop()
+            _schedulers.pop(event.widget,None)
+
+
+# root window -> TimerWheel
+_schedulers = weakref.WeakKeyDictionary()
+
+def scheduler(widget):
+    """Returns the TimerWheel shared by all widgets in the specified
+    widget's Tk interpreter"""
+    root = widget._root()
+    try:
+        return _schedulers[root]
+    except KeyError:
+        wheel = _schedulers[root] = TimerWheel(root)
+        # the pending timers' callbacks (e.g. bound methods of widgets)
+        # would otherwise keep the root alive once destroyed
+        root.bind("<Destroy>",wheel._handle_destroy,add="+")
+        return wheel
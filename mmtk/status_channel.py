@@ -0,0 +1,157 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import tkinter as tk
+
+from collections import deque
+from itertools import count
+from time import perf_counter
+
+from .status_label import OptionError, StatusStates
+
+class StatusChannel:
+    """Thread-safe conduit for posting status updates to StatusLabel widgets.
+
+    Tkinter widgets may only be touched from the thread running the Tk
+    event loop.  A StatusChannel allows any thread to post status updates
+    which are then applied to their StatusLabel widgets on the Tk thread.
+
+    Posting never blocks.  Updates are appended to a bounded queue which
+    is drained in batches on the Tk thread every `interval` milliseconds.
+    Within a batch, only the most recent update for each label is applied;
+    the others are counted as coalesced.  If producers get so far ahead
+    that the queue fills, the oldest updates are dropped.
+
+    The channel must be created on the Tk thread.  It may be shared by any
+    number of StatusLabel widgets.
+    """
+
+    _states = (None,*StatusStates)
+
+    def __init__(self,master,*,interval=20,maxlen=100000):
+        """StatusChannel constructor
+
+        Args:
+            master (widget): any widget in the Tk interpreter that owns
+                the StatusLabels to be updated
+            interval (int): milliseconds between queue drains
+            maxlen (int): maximum number of queued updates
+        """
+        self.master = master
+        self.interval = interval
+
+        self._queue = deque(maxlen=maxlen)
+        self._seq = count()
+
+        # statistics (only ever touched on the Tk thread)
+        self._high_seq = -1
+        self._received = 0
+        self._delivered = 0
+        self._coalesced = 0
+        self._discarded = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+        self._drain_id = master.after(interval,self._drain)
+
+    def post(self,label,state,msg):
+        """Queues a status update for the specified label.
+
+        May be called from any thread.
+
+        Args:
+            label (StatusLabel): the label to update
+            state (str or None): the new status state (info, warning,
+                error, or None to clear the status)
+            msg (str): the text to show
+        Raises: OptionError if an invalid state is specified
+        """
+        if state not in self._states:
+            raise OptionError(f"Invalid state: {state}")
+        self._queue.append((next(self._seq),perf_counter(),label,state,msg))
+
+    def drain(self):
+        """Applies the updates queued at the time of the call.
+
+        Must be called on the Tk thread.  This is done automatically
+        every `interval` milliseconds, but may also be called directly.
+
+        Updates posted while draining are left for the next drain, so
+        producers which keep posting cannot hold up the Tk thread.
+
+        Returns (int): the number of labels updated
+        """
+        queue = self._queue
+        latest = dict()
+        for _ in range(len(queue)):
+            try:
+                update = queue.popleft()
+            except IndexError:
+                break
+            label = update[2]
+            if label in latest:
+                self._coalesced += 1
+            latest[label] = update
+            self._received += 1
+            if update[0] > self._high_seq:
+                self._high_seq = update[0]
+
+        now = perf_counter()
+        for label,(_,posted,_,state,msg) in latest.items():
+            try:
+                label._post_state(state,msg)
+            except tk.TclError:
+                # label has been destroyed
+                self._discarded += 1
+                continue
+            latency = now - posted
+            self._delivered += 1
+            self._total_latency += latency
+            if latency > self._max_latency:
+                self._max_latency = latency
+
+        return len(latest)
+
+    def close(self):
+        """Stops draining the queue.  Any queued updates are discarded."""
+        if self._drain_id is not None:
+            self.master.after_cancel(self._drain_id)
+            self._drain_id = None
+        self._queue.clear()
+
+    def stats(self):
+        """Returns a dictionary of channel statistics.
+
+        - posted: number of updates posted (as seen by the Tk thread)
+        - received: number of updates taken off the queue
+        - delivered: number of updates applied to a label
+        - coalesced: number of updates superseded by a later update
+        - dropped: number of updates lost to queue overflow
+        - discarded: number of updates for labels that no longer exist
+        - queued: number of updates currently waiting in the queue
+        - mean_latency: mean seconds from post to delivery
+        - max_latency: maximum seconds from post to delivery
+
+        The posted and dropped counts are exact once producers are idle
+        and the queue has been drained.
+        """
+        posted = self._high_seq + 1
+        return {
+            "posted": posted,
+            "received": self._received,
+            "delivered": self._delivered,
+            "coalesced": self._coalesced,
+            "dropped": posted - self._received,
+            "discarded": self._discarded,
+            "queued": len(self._queue),
+            "mean_latency": (
+                self._total_latency/self._delivered if self._delivered else 0.0
+            ),
+            "max_latency": self._max_latency,
+        }
+
+    def _drain(self):
+        """Periodic queue drain"""
+        self.drain()
+        self._drain_id = self.master.after(self.interval,self._drain)
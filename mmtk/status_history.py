@@ -0,0 +1,115 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+from array import array
+from time import time
+
+from .status_label import OptionError, StatusStates, _state_index
+
+class StatusHistory:
+    """Bounded record of the most recent status messages of a StatusLabel.
+
+    Each entry is a (timestamp, state, text) tuple, where timestamp is
+    in seconds since the epoch (as returned by time.time) and state is
+    info, warning, error, or None (cleared).
+
+    The history is a ring buffer allocated in full when it is created:
+    timestamps are kept in an array of doubles, states in an array of
+    bytes, and texts in a list of references.  Once the buffer is full,
+    each new entry overwrites the oldest, so memory use stays constant no
+    matter how many messages are recorded.
+
+    All of the query methods return entries from oldest to newest.
+    """
+
+    _states = (None,*StatusStates)
+    _codes = _state_index
+
+    def __init__(self,size=10000):
+        """StatusHistory constructor
+
+        Args:
+            size (int): maximum number of entries kept
+        """
+        if size < 1:
+            raise ValueError(f"StatusHistory size must be positive: {size}")
+        self.size = size
+        self._times = array("d",bytes(8*size))
+        self._state_codes = array("b",bytes(size))
+        self._texts = [None] * size
+        self._next = 0      # index at which the next entry is stored
+        self._count = 0     # number of entries stored (at most size)
+
+    def __len__(self):
+        return self._count
+
+    def append(self,state,text,timestamp=None):
+        """Records a status message
+
+        Args:
+            state (str or None): info, warning, error, or None (cleared)
+            text (str): the status text
+            timestamp (float): when the message was posted (default: now)
+        Raises:
+            OptionError if an invalid state is specified
+        """
+        try:
+            code = self._codes[state]
+        except (KeyError,TypeError):
+            raise OptionError(f"Invalid status state: {state}")
+        i = self._next
+        self._times[i] = time() if timestamp is None else timestamp
+        self._state_codes[i] = code
+        self._texts[i] = text
+        self._next = (i + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+
+    def clear(self):
+        """Discards all of the entries"""
+        self._texts = [None] * self.size
+        self._next = 0
+        self._count = 0
+
+    def _indices(self,k=None):
+        """Returns the buffer indices of the last k entries (default all),
+        oldest first"""
+        n = self._count if k is None else max(0,min(k,self._count))
+        start = self._next - n
+        if start >= 0:
+            return range(start,self._next)
+        return [*range(start + self.size,self.size),*range(self._next)]
+
+    def _entry(self,i):
+        return (self._times[i],self._states[self._state_codes[i]],self._texts[i])
+
+    def __iter__(self):
+        return (self._entry(i) for i in self._indices())
+
+    def last(self,k=1):
+        """Returns (list): the k most recent entries"""
+        return [self._entry(i) for i in self._indices(k)]
+
+    def by_state(self,state):
+        """Returns (list): the entries with the specified state
+
+        Raises:
+            OptionError if an invalid state is specified
+        """
+        try:
+            code = self._codes[state]
+        except (KeyError,TypeError):
+            raise OptionError(f"Invalid status state: {state}")
+        codes = self._state_codes
+        return [self._entry(i) for i in self._indices() if codes[i] == code]
+
+    def since(self,timestamp):
+        """Returns (list): the entries recorded at or after timestamp"""
+        times = self._times
+        indices = self._indices()
+        # entries are recorded in time order: scan back from the newest
+        n = len(indices)
+        while n > 0 and times[indices[n-1]] >= timestamp:
+            n -= 1
+        return [self._entry(i) for i in indices[n:]]
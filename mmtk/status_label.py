@@ -5,10 +5,16 @@
 import tkinter as tk
 from tkinter.font import Font, nametofont
 
-import re
-from copy import deepcopy
+import weakref
+from contextlib import contextmanager
+from math import ceil
+from time import monotonic
+from types import MappingProxyType
 from abc import abstractmethod
 
+from .font_pool import FontPool
+from .scheduler import scheduler
+
 
 ################################################################################
 # Support values, exceptions, and functions
@@ -18,6 +24,9 @@ WARNING = "warning"
 ERROR = "error"
 StatusStates = (INFO,WARNING,ERROR)
 
+# Internally, option values are stored and looked up by state index
+_state_index = MappingProxyType({None:0, INFO:1, WARNING:2, ERROR:3})
+
 class OptionError(ValueError):
     """The exception class used by StatusLabel"""
     def __init__(self,err):
@@ -26,6 +35,10 @@ class OptionError(ValueError):
 def parse_key(key):
     """Parses a StatusLabel option key into its base widget option and status state
 
+    Recognized keys are looked up in a table built at import time.  Any
+    other key is split on a leading status state (if any) so that the
+    caller can report it as an invalid option.
+
     Args:
         key (str): A StatusLabel widget option
     Returns (tuple):
@@ -34,13 +47,89 @@ def parse_key(key):
     Raises: 
         OptionError if the specifed key is not a recognized StatusLabel option
     """
-    states = "|".join(StatusStates)
     try:
-        m = re.match(rf"({states})_?(.*)",key)
-    except:
+        return _parsed_keys[key]
+    except KeyError:
+        pass
+    except TypeError:
+        raise OptionError(f"Cannot parse option key: {key}")
+
+    if type(key) is not str:
         raise OptionError(f"Cannot parse option key: {key}")
 
-    return (m.group(2), m.group(1)) if m else (key,None)
+    for state in StatusStates:
+        if key.startswith(state):
+            option = key[len(state):]
+            if option.startswith("_"):
+                option = option[1:]
+            return (option, state)
+
+    return (key,None)
+
+# The Tk widget class of StatusLabel widgets, used to look up their
+# options in the Tk option database (e.g. *StatusLabel.warningBackground)
+WIDGET_CLASS = "StatusLabel"
+
+def database_names(dbname,dbclass,state=None):
+    """Returns the Tk option database name and class of a state specific
+    variant of a widget option (e.g. warningBackground, WarningBackground)
+    """
+    if state is None:
+        return dbname,dbclass
+    return f"{state}{dbname[0].upper()}{dbname[1:]}", f"{state.title()}{dbclass}"
+
+# tk.Label option metadata keyed by root window (i.e. Tk interpreter)
+_inherited_configs = weakref.WeakKeyDictionary()
+
+def inherited_config(option,root=None):
+    """Returns the tk.Label configuration record for the specified option
+
+    The records for all of the recognized options are retrieved at once
+    from a single probe label (which is then destroyed) the first time
+    this is called for a given Tk interpreter.  Subsequent calls simply
+    return the cached record.  As the probe is of the StatusLabel widget
+    class, the current values reflect any StatusLabel entries in the Tk
+    option database (e.g. *StatusLabel.background).
+
+    Args:
+        option (str): One of the recognized StatusLabel widget options
+        root (widget): root window of the Tk interpreter (default: the
+            default root)
+    Returns (tuple): (name, dbname, dbclass, default, value)
+    Raises: KeyError if option is not a tk.Label option
+    """
+    root = root or tk._get_default_root()
+    try:
+        configs = _inherited_configs[root]
+    except KeyError:
+        probe = tk.Label(root,class_=WIDGET_CLASS)
+        configs = {
+            name:config for name,config in probe.configure().items()
+            if name in Option.recognized_options()
+        }
+        probe.destroy()
+        _inherited_configs[root] = configs
+    return configs[option]
+
+def reload_option_database(widget=None):
+    """Discards the StatusLabel defaults cached for the widget's Tk
+    interpreter (default: that of the default root), so that StatusLabels
+    created from then on reflect the current StatusLabel entries in the
+    Tk option database.
+
+    The defaults are read from the option database once per interpreter
+    (see inherited_config and Options._prototype).  Call this after adding
+    or changing *StatusLabel entries once StatusLabels have been created.
+    Existing StatusLabels are not affected.
+    """
+    root = widget._root() if widget is not None else tk._get_default_root()
+    _inherited_configs.pop(root,None)
+    Options._prototypes.pop(root,None)
+
+
+# bold/italic variants of StatusLabel fonts shared by all StatusLabel widgets
+# keyed by (base font attributes, bold, italic)
+_derived_fonts = FontPool()
 
 
 ################################################################################
@@ -80,11 +169,16 @@ class Option:
     _status_statess =(None, *StatusStates)
     _option_type = "status"
 
-    def __init__(self,option,common_value=None,**state_values):
+    # state values are kept in a list indexed by _state_index
+    __slots__ = ("name", "inherited", "common", "default", "_values")
+
+    def __init__(self,option,common_value=None,*,root=None,**state_values):
         """Option constructor
         Args:
             option (str): One of the recognized StatusLabel widget options
             common_value: base option value (see below)
+            root (widget): root window of the Tk interpreter whose tk.Label
+                defaults apply (default: the default root)
             state_values (kwargs): state option values (see below)
 
             The common value is used by all states (including normal) if
@@ -102,15 +196,28 @@ class Option:
         if option not in self.recognized_options():
             raise OptionError(f"Unknown {self._option_type}: {option}")
 
-        self._setup_config(common_value,**state_values)
+        self._setup_config(common_value,root)
 
-        self.values = dict()
+        self._values = [None] * len(_state_index)
         for state in self._status_statess:
-            self.values[state] = state_values.get(state,None)
+            self._values[_state_index[state]] = state_values.get(state,None)
+
+    @property
+    def values(self):
+        """the option values (dict) keyed by state"""
+        return {
+            state:self._values[_state_index[state]]
+            for state in self._status_statess
+        }
 
-    def _setup_config(self,common_value,**state_values):
+    @classmethod
+    def database_names(cls,option,root=None):
+        """Returns the (dbname, dbclass) of the option in the Tk option database"""
+        return inherited_config(option,root)[1:3]
+
+    def _setup_config(self,common_value,root=None):
         """initializes the Option type speci common and default values"""
-        self.inherited = tk.Label().configure(self.name)
+        self.inherited = inherited_config(self.name,root)
 
         if common_value is None:
             self.common = self.inherited[-1]
@@ -119,11 +226,12 @@ class Option:
             self.common = common_value
             self.default = common_value
 
-    def _get_config(self,state):
-        """retrieves the default and current option values for a given state"""
-        value = self.values[state]
+    def _get_config(self,index):
+        """retrieves the default and current option values for a given
+        state index"""
+        value = self._values[index]
         if value is None:
-            value = self.values[None]
+            value = self._values[0]
         if value is None:
             value = self.common
         if value is None:
@@ -151,16 +259,11 @@ class Option:
             raise OptionError(f"Invalid option: {state or ''}{self.name}")
 
         name,dbname,dbclass,default,value = self.inherited
-
-        try:
-            default,value = self._get_config(state)
-        except KeyError:
-            raise RuntimeError(f"Coding error... should not get here")
+        default,value = self._get_config(_state_index[state])
 
         if state is not None:
             name = f"{state}{self.name}"
-            dbname = f"{state}{dbname[0].upper()}{dbname[1:]}"
-            dbclass = f"{state.title()}{dbclass}"
+            dbname,dbclass = database_names(dbname,dbclass,state)
 
         return (name, dbname, dbclass, default, value)
 
@@ -171,6 +274,16 @@ class Option:
         """
         return [ self.config_entry(state) for state in self._status_statess ]
 
+    def copy(self):
+        """returns a copy of this option whose values may be updated
+        without affecting this option"""
+        option = object.__new__(type(self))
+        for cls in type(self).__mro__:
+            for slot in getattr(cls,"__slots__",()):
+                setattr(option,slot,getattr(self,slot))
+        option._values = list(self._values)
+        return option
+
     def update(self,value,state=None):
         """updates the option value for the specified state
         Args:
@@ -180,7 +293,7 @@ class Option:
         """
         if state not in self._status_statess:
             raise OptionError(f"Invalid option: {state or ''}{self.name}")
-        self.values[state] = value
+        self._values[_state_index[state]] = value
 
     def value(self,state=None):
         """returns the option value for the specified state
@@ -188,10 +301,9 @@ class Option:
             state (str or None), the state with which to associate the value
         Raises: OptionError if an invalid state is specified.
         """
-        try:
-            return self.values[state]
-        except KeyError:
+        if state not in self._status_statess:
             raise OptionError(f"Invalid state: {state}")
+        return self._values[_state_index[state]]
 
 
 ####################
@@ -224,11 +336,14 @@ class FontOption(Option):
     _status_statess = StatusStates
     _option_type = "font"
 
-    def __init__(self,option,common_value=False,**state_values):
+    __slots__ = ("defaults",)
+
+    def __init__(self,option,common_value=False,*,root=None,**state_values):
         """Option constructor
         Args:
             option (str): One of the recognized StatusLabel font modifiers
             common_value: base option value (see below)
+            root (widget): unused (font modifiers are not Tk options)
             state_values (kwargs): state option values (see below)
 
             The common value is used by all states (including normal) if
@@ -242,22 +357,30 @@ class FontOption(Option):
         recognized font options.
         """
         common_value = bool(common_value)
-        super().__init__(option,common_value,**state_values)
-        for state in (s for s,v in self.values.items() if v is None):
-            self.values[state] = common_value
-        self.defaults = deepcopy(self.values)
+        super().__init__(option,common_value,root=root,**state_values)
+        for state in self._status_statess:
+            index = _state_index[state]
+            if self._values[index] is None:
+                self._values[index] = common_value
+        # the initial values (by state index) are the defaults
+        self.defaults = tuple(self._values)
+
+    @classmethod
+    def database_names(cls,option,root=None):
+        """overrides the inherited database_names for font modifier options"""
+        return option, option.title()
 
-    def _setup_config(self,common_value,**state_values):
+    def _setup_config(self,common_value,root=None):
         """overrides the inherited _setup_config for font modifier options"""
         self.inherited = (
-            self.name, self.name, self.name.title(), common_value, common_value
+            self.name, *self.database_names(self.name), common_value, common_value
         )
         self.common = common_value
         self.default = common_value
 
-    def _get_config(self,state):
+    def _get_config(self,index):
         """overrides the inherited _get_config for font modifier options"""
-        return self.defaults[state], self.values[state]
+        return self.defaults[index], self._values[index]
 
 
 ####################
@@ -282,6 +405,9 @@ class Synonym():
         "fg":"foreground",
         "bd":"borderwidth",
     }
+
+    __slots__ = ("name", "target")
+
     @classmethod
     def recognized_synonyms(cls):
         """Returns the list of all tk.Label synonyms used by StatusLabel"""
@@ -363,6 +489,28 @@ class Synonym():
         return self.target.value(state)
 
 
+################################################################################
+# Option key lookup table (used by parse_key)
+################################################################################
+
+def _build_key_table():
+    """Maps every recognized option key to its (option, state) pair"""
+    options = (
+        *Option.recognized_options(),
+        *FontOption.recognized_options(),
+        *Synonym.recognized_synonyms(),
+    )
+    table = dict()
+    for option in options:
+        table[option] = (option,None)
+        for state in StatusStates:
+            table[f"{state}{option}"] = (option,state)
+            table[f"{state}_{option}"] = (option,state)
+    return MappingProxyType(table)
+
+_parsed_keys = _build_key_table()
+
+
 ################################################################################
 # Options - Complete set of all Option, FontOption, and Synonym instances
 ################################################################################
@@ -370,6 +518,13 @@ class Synonym():
 class Options:
     """Collection of all of the options and synonyms associated with a
     given StatusLabel widget instance
+
+    Options instances are copy-on-write.  All instances created for a
+    given Tk interpreter start out sharing a single prototype set of
+    Option instances holding the default values.  An Option is copied
+    (and the Synonyms referencing it relinked) only when an instance
+    first modifies it, so each instance holds only the options that it
+    overrides.  The shared options must never be modified in place.
     """
     _defaults = {
         "info" : {
@@ -390,31 +545,149 @@ class Options:
         },
     }
 
-    def __init__(self,**values):
+    # default option instances shared by all Options instances
+    #   keyed by root window (i.e. Tk interpreter)
+    _prototypes = weakref.WeakKeyDictionary()
+
+    # root windows whose option database holds the built-in defaults
+    _registered = weakref.WeakSet()
+
+    @classmethod
+    def _prototype(cls,root=None):
+        """Returns the default option instances for the Tk interpreter of
+        the specified root window (default: the default root), creating
+        them the first time this is called
+
+        The built-in status state defaults (_defaults) are first added to
+        the Tk option database at widgetDefault priority.  The state
+        specific default of every option is then looked up in the option
+        database, so that any entries with a higher priority (e.g. from an
+        X resources file read with option_readfile) take precedence.
+        """
+        root = root or tk._get_default_root()
+        try:
+            return cls._prototypes[root]
+        except KeyError:
+            pass
+
+        # (the built-in defaults are only added once, so that reloading
+        # does not replace any widgetDefault entries added since)
+        register = root not in cls._registered
+        cls._registered.add(root)
+
+        probe = tk.Label(root,class_=WIDGET_CLASS)
+        options = dict()
+        for option_class in (Option,FontOption):
+            for option in option_class.recognized_options():
+                dbname,dbclass = option_class.database_names(option,root)
+                values = dict()
+                for state in StatusStates:
+                    names = database_names(dbname,dbclass,state)
+                    value = cls._defaults[state].get(option)
+                    if register and value is not None:
+                        root.option_add(
+                            f"*{WIDGET_CLASS}.{names[0]}", value, "widgetDefault"
+                        )
+                    value = str(probe.option_get(*names))
+                    if value:
+                        if option_class is FontOption:
+                            value = root.getboolean(value)
+                        values[state] = value
+                options[option] = option_class(option,root=root,**values)
+        probe.destroy()
+
+        for synonym in Synonym.recognized_synonyms():
+            options[synonym] = Synonym(synonym,options)
+
+        prototype = cls._prototypes[root] = MappingProxyType(options)
+        return prototype
+
+    def __init__(self,root=None,/,**values):
         """Options constructor
         Args:
+            root (widget): root window of the Tk interpreter in which the
+                options are used (default: the default root)
             values (kwargs): StatusLabel widget options and values
         Raises: OptionError if any of the value keywords is not recognized
         """
-        defaults = dict()
-        for state,options in self._defaults.items():
-            for option,value in options.items():
-                try:
-                    defaults[option][state] = value
-                except KeyError:
-                    defaults[option] = {state:value}
+        self.root = root or tk._get_default_root()
 
-        self.options = dict()
+        # shared with the prototype (and other Options) until modified
+        self.options = self._prototype(self.root)
+        self._owned = None
 
-        for option in Option.recognized_options():
-            self.options[option] = Option(option,**defaults.get(option,{}))
-        for option in FontOption.recognized_options():
-            self.options[option] = FontOption(option,**defaults.get(option,{}))
-        for synonym in Synonym.recognized_synonyms():
-            self.options[synonym] = Synonym(synonym,self.options)
+        self._init_caches()
 
         self.configure(**values)
 
+    def _init_caches(self):
+        # resolved kwargs are cached per state index and tagged with the
+        # state's version number, which is bumped whenever an option changes
+        self._versions = [0] * len(_state_index)
+        self._kwargs = [None] * len(_state_index)
+
+        # the full configure() dump is cached along with the overall
+        # version number, which is bumped whenever any option changes
+        self._version = 0
+        self._dump = None
+
+        # bold/italic fonts acquired from the shared pool of derived fonts
+        self._fonts = dict()
+
+    def copy(self):
+        """Returns a new Options instance with the same option values.
+        The two instances share their options until either modifies them.
+        """
+        options = object.__new__(type(self))
+        options.root = self.root
+        options.options = self.options
+        options._owned = None
+        options._init_caches()
+        options._version = self._version
+        options._dump = self._dump
+        # the options owned by this instance are now shared as well
+        self._owned = None
+        return options
+
+    def share(self,options):
+        """Replaces the named options with the specified (shared) option
+        instances, e.g. those of a StatusPalette.  The shared instances
+        are copied if they are later modified through these Options.
+
+        Args:
+            options (dict): option name -> Option instance
+        """
+        if self._owned is None:
+            self.options = dict(self.options)
+            self._owned = set()
+        for name,option in options.items():
+            self.options[name] = option
+            self._owned.discard(name)
+        for synonym in Synonym.recognized_synonyms():
+            if self.options[synonym].target.name in options:
+                self.options[synonym] = Synonym(synonym,self.options)
+        self._invalidate(0)
+
+    def _writable(self,name):
+        """Returns the named Option, first copying it if it is shared"""
+        option = self.options[name]
+        if type(option) is Synonym:
+            option = option.target
+            name = option.name
+
+        if self._owned is None:
+            self.options = dict(self.options)
+            self._owned = set()
+        elif name in self._owned:
+            return option
+
+        option = option.copy()
+        self.options[name] = option
+        self._owned.add(name)
+        for synonym in Synonym.recognized_synonyms():
+            if self.options[synonym].target.name == name:
+                self.options[synonym] = Synonym(synonym,self.options)
+        return option
 
     def configure(self,key=None,**kwargs):
         """Bridget between StatusLabel's configure method and the state
@@ -435,6 +708,9 @@ class Options:
 
         If you provide a single option keyword, the configure tuple will be
         returned for just that option.
+
+        The dictionary of all option values is cached until an option is
+        modified.  It is returned as a read-only mapping.
         """
         if kwargs and key:
             raise TypeError("Cannot specify both key and kwargs")
@@ -457,29 +733,37 @@ class Options:
             for key,value in kwargs.items():
                 try:
                     option,state = parse_key(key)
-                    self.options[option].update(value,state)
+                    self._writable(option).update(value,state)
                 except KeyError:
                     raise OptionError(f"invalid option: {key}")
                 else:
                     modified_states.add(state)
+                    self._invalidate(_state_index[state])
             return modified_states
 
         else:
-            return dict(
+            dump = self._dump
+            if dump and dump[0] == self._version:
+                return dump[1]
+            result = MappingProxyType(dict(
                 sorted([
                     (config[0],config)
                     for option in self.options.values()
                     for config in option.config_entries()
                 ])
-            )
+            ))
+            self._dump = (self._version,result)
+            return result
 
     def cget(self,key,*,actual=False):
         """Returns the current value for the specified option key"""
         if actual:
             try:
                 option,state = parse_key(key)
-                return self.options[option].values[state]
-            except (KeyError,TypeError,AttributeError) as e:
+                option = self.options[option]
+                if type(option) is not Synonym:
+                    return option.value(state)
+            except (KeyError,TypeError,OptionError) as e:
                 pass
 
         if key.endswith("font"):
@@ -502,6 +786,7 @@ class Options:
         bold = self.cget(state+"bold")
 
         if not (bold or italic):
+            self._release_font(state)
             return font
 
         if not isinstance(font,Font):
@@ -513,35 +798,92 @@ class Options:
 
             if type(font) is str:
                 try:
-                    font = nametofont(font)
+                    font = Font(self.root,name=font,exists=True)
                 except:
-                    font = Font(family=font)
+                    font = Font(self.root,family=font)
             elif type(font) is dict:
-                font = Font(**font)
+                font = Font(self.root,**font)
             else:
                 raise OptionError(f"Cannot convert {font} to tk.Font")
 
         font = font.actual()
+        key = (tuple(sorted(font.items())), bool(bold), bool(italic))
+        held = self._fonts.get(state)
+        if held and held[0] == key:
+            return held[1]
+
         if bold:
             font['weight'] = tk.font.BOLD
         if italic:
             font['slant'] = tk.font.ITALIC
 
-        return Font(**font)
+        font = _derived_fonts.acquire(key,font,self.root)
+        self._release_font(state)
+        self._fonts[state] = (key,font,self.root)
+        return font
+
+    def _release_font(self,state):
+        """Returns the derived font held for the specified state (if any)
+        to the shared pool of derived fonts"""
+        try:
+            _,font,root = self._fonts.pop(state)
+        except KeyError:
+            return
+        _derived_fonts.release(font,root)
+
+    def release_fonts(self):
+        """Returns all derived fonts held by these options to the shared
+        pool of derived fonts.  Should be called when the StatusLabel
+        using these options is destroyed."""
+        for state in list(self._fonts):
+            self._release_font(state)
 
     def kwargs(self,state=""):
         """Returns a dictionary of all the currently set options for the
         specified state in a form suitable for passing to tk.Label's
         configure method.
 
+        The result is cached until an option affecting the specified state
+        is modified.  It is shared between calls and must not be modified.
+
         Raises: OptionError if an invalid state is specified
         """
+        state = state or None
+        try:
+            index = _state_index[state]
+        except (KeyError,TypeError):
+            raise OptionError(f"Invalid state: {state}")
+
+        version = self._versions[index]
+        cached = self._kwargs[index]
+        if cached and cached[0] == version:
+            return cached[1]
+
         rval = dict()
         for name,option in self.options.items():
-            if type(option) == Option:
-                rval[name] = self.cget((state or "")+name)
+            if type(option) is Option:
+                if name == "font":
+                    rval[name] = self.font(state)
+                else:
+                    rval[name] = option._get_config(index)[1]
+
+        self._kwargs[index] = (version,rval)
         return rval
 
+    def _invalidate(self,index):
+        """Marks the cached kwargs for the specified state index (and the
+        cached configure() dump) as out of date.  As the common (None)
+        state values cascade into the status states, modifying them
+        invalidates all of the states.
+        """
+        self._version += 1
+        versions = self._versions
+        if index == 0:
+            for index in range(len(versions)):
+                versions[index] += 1
+        else:
+            versions[index] += 1
+
 
 ################################################################################
 # StatusLabel - Finally, we get to the widget itself
@@ -569,6 +911,55 @@ class StatusLabel (tk.Label):
     font has not been specified.  In this case the base font will be
     used with italicization or boldness added.
 
+    By default, every call to info, warning, error, or clear updates the
+    widget immediately.  If max_refresh_hz is specified, updates are
+    buffered and the widget is refreshed at most that many times per
+    second, always showing the most recent status.  Errors bypass this
+    throttle (and are shown immediately) unless throttle_errors is True.
+
+    None of the above methods may be called from any thread other than
+    the one running the Tk event loop.  Other threads should instead use
+    the post method, which requires that the widget be given a
+    StatusChannel (via the channel option) to carry the updates over to
+    the Tk thread.
+
+    All StatusLabels share a single copy of the default option values,
+    each keeping its own copy of only those options it overrides.  A
+    StatusLabel may also be created as a copy of another
+    (prototype) StatusLabel using from_prototype or clone, in which case
+    only the options later modified in either widget are duplicated.
+
+    If history_size is specified, the widget keeps a StatusHistory of
+    that many of its most recent status messages (including those never
+    shown due to throttling), available as the history attribute.
+
+    StatusLabel widgets are of the Tk widget class StatusLabel, whose
+    defaults (including those of each status state) may be set in the Tk
+    option database, e.g. from an X resources file:
+
+        *StatusLabel.background: white
+        *StatusLabel.warningBackground: orange
+        *StatusLabel.errorBold: false
+
+    Class level entries such as these must be in place before the first
+    StatusLabel (or Options) is created for the Tk interpreter, or else
+    be followed by a call to reload_option_database.
+
+    If min_display is specified (a dictionary of seconds keyed by state),
+    each message is shown for at least that long unless a more severe
+    message arrives.  Messages that cannot be shown yet are queued (up to
+    max_queued of them, keeping only the newest of each state) and shown
+    in order of severity (see MessageQueue).
+
+    Errors may be cleared automatically after a timeout and warnings may
+    be flashed (see error and warning).  These effects are run by the
+    shared mmtk scheduler and are cancelled by any subsequent status
+    change.
+
+    Several configuration and status changes can be combined into a
+    single update of the underlying widget using the batch context
+    manager.
+
     The following table outlines all of the options recognized by
     StatusLabel.  Where there are built-in default values, that 
     value is shown in the table.
@@ -607,14 +998,94 @@ class StatusLabel (tk.Label):
     | width               |    x    |    x    |    x    |    x    |
     +---------------------+---------+---------+---------+---------+
     """
-    def __init__( self, parent, text="", **kwargs):
-        self.options = Options(**kwargs)
+    # number of times and seconds between appearance changes of warning(flash=True)
+    flash_count = 6
+    flash_interval = 0.25
+
+    def __init__(
+        self,
+        parent,
+        text="",
+        *,
+        max_refresh_hz=None,
+        throttle_errors=False,
+        channel=None,
+        history_size=None,
+        min_display=None,
+        max_queued=100,
+        prototype=None,
+        **kwargs
+    ):
+        if prototype is None:
+            self.options = Options(parent._root(),**kwargs)
+        else:
+            self.options = prototype.options.copy()
+            self.options.configure(**kwargs)
 
         self._state = None
         self._text = text
 
+        # throttled updates (see _post_state)
+        self._refresh_interval = 1/max_refresh_hz if max_refresh_hz else None
+        self._throttle_errors = throttle_errors
+        self._pending = None
+        self._refresh_id = None
+        self._last_refresh = 0.0
+
+        self.channel = channel
+
+        # pending auto-clear or flash Timer (see error and warning)
+        self._effect = None
+
+        if min_display:
+            from .message_queue import MessageQueue
+            self.message_queue = MessageQueue(self,min_display,max_queued)
+        else:
+            self.message_queue = None
+
+        if history_size:
+            from .status_history import StatusHistory
+            self.history = StatusHistory(history_size)
+        else:
+            self.history = None
+
+        # Tk finds the default values itself (in the option database or
+        # its built-in defaults), so only the values differing from the
+        # prototype's are passed.  (This is why reload_option_database must
+        # be called after the option database changes.)
         kwargs = self.options.kwargs()
-        super().__init__(parent, text=text, **kwargs)
+        prototype = Options._prototype(self.options.root)
+        overrides = dict()
+        for key,value in kwargs.items():
+            default = prototype[key]._get_config(0)[1]
+            if value is not default and value != default:
+                overrides[key] = value
+        super().__init__(parent, class_=WIDGET_CLASS, text=text, **overrides)
+
+        # option values currently applied to the underlying Tk widget
+        self._applied = {**kwargs, "text":text}
+
+        # option values deferred until the outermost batch block exits
+        self._batch_depth = 0
+        self._deferred = dict()
+
+    @classmethod
+    def from_prototype(cls,parent,prototype,text="",**kwargs):
+        """Creates a StatusLabel with the same option values as the
+        prototype StatusLabel (other than those specified in kwargs).
+        The new widget shares the prototype's options until either
+        widget modifies them.
+        """
+        return cls(parent,text,prototype=prototype,**kwargs)
+
+    def clone(self,parent=None,text="",**kwargs):
+        """Creates a StatusLabel with the same option values as this one
+        in the specified parent (default: this widget's parent).
+        See from_prototype.
+        """
+        if parent is None:
+            parent = self.master
+        return self.from_prototype(parent,self,text,**kwargs)
 
     @property
     def state(self):
@@ -635,11 +1106,32 @@ class StatusLabel (tk.Label):
         if type(result) is not set:
             return result
         if self._state in result or None in result:
-            config = self.options.kwargs(self._state)
-            super().configure(**config)
+            self._apply(self.options.kwargs(self._state))
 
     config = configure
 
+    @contextmanager
+    def batch(self):
+        """Context manager which defers updating the underlying tk.Label
+        until the block exits.  All of the option and status changes made
+        within the block are then applied with a single configure call.
+        Blocks may be nested; the update is made when the outermost exits.
+
+            with label.batch():
+                label.configure(infobg="green")
+                label["errorrelief"] = "groove"
+                label.info("restyled")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._deferred:
+                deferred = self._deferred
+                self._deferred = dict()
+                self._apply(deferred)
+
     def cget(self,key,*,actual=False):
         """Query widget configuration resource
         This method overrides the method inherited from tk.Label
@@ -649,33 +1141,180 @@ class StatusLabel (tk.Label):
         return self.options.cget(key,actual=actual)
 
     def info(self,msg):
-        self._set_state(INFO,msg)
+        self._post_state(INFO,msg)
 
-    def warning(self,msg):
-        self._set_state(WARNING,msg)
+    def warning(self,msg,*,flash=False):
+        """Shows a warning message.  If flash is True, the widget flashes
+        (alternating between its warning and normal appearance) flash_count
+        times, flash_interval seconds apart, before settling on the warning.
+        """
+        self._post_state(WARNING,msg)
+        if flash:
+            self._effect = scheduler(self).schedule(
+                self.flash_interval,self._flash,self.flash_count-1
+            )
 
-    def error(self,msg):
-        self._set_state(ERROR,msg)
+    def error(self,msg,*,timeout=None):
+        """Shows an error message.  If timeout is specified, the widget
+        is cleared after that many seconds unless its status has been
+        changed in the meantime.
+        """
+        self._post_state(ERROR,msg)
+        if timeout is not None:
+            self._effect = scheduler(self).schedule(timeout,self.clear)
 
     def clear(self,text=None):
         if text is not None:
             self._text = text
         if text is None:
             self._text = ""
-        self._set_state(None,self._text)
+        self._post_state(None,self._text)
+
+    def post(self,state,msg):
+        """Thread-safe request to change the status state and text.
+        The update is applied on the Tk thread by the widget's StatusChannel.
+
+        Args:
+            state (str or None): info, warning, error, or None (clear)
+            msg (str): the text to show
+        Raises:
+            RuntimeError if the widget was not given a StatusChannel
+            OptionError if an invalid state is specified
+        """
+        if self.channel is None:
+            raise RuntimeError("StatusLabel has no StatusChannel")
+        self.channel.post(self,state,msg)
+
+    async def flash_error(self,msg,seconds=3):
+        """Shows an error message for the specified number of seconds
+        (see mmtk.aio.flash).  Requires a running asyncio event loop.
+        """
+        from .aio import flash
+        await flash(self,ERROR,msg,seconds)
+
+    def destroy(self):
+        """Releases any shared resources and destroys the widget
+        This method overrides the method inherited from tk.Label
+        """
+        self._cancel_refresh()
+        self._cancel_effect()
+        if self.message_queue is not None:
+            self.message_queue.close()
+        self._deferred.clear()
+        self.options.release_fonts()
+        super().destroy()
+
+    def _post_state(self,state,msg):
+        """Requests a change of status state and text.
+
+        Unless the widget is throttled (or queued), the change is applied immediately.
+        Otherwise, only the most recent request is kept and a single
+        refresh is scheduled for when the refresh interval has elapsed.
+
+        Every request is recorded in the history (if any), whether or not
+        it is ever shown.  If the widget has a message queue, the request
+        is passed through it (see MessageQueue).
+        """
+        if self.history is not None:
+            self.history.append(state,msg)
+
+        self._cancel_effect()
+
+        if self.message_queue is None:
+            self._show_state(state,msg)
+        else:
+            self.message_queue.post(state,msg)
+
+    def _show_state(self,state,msg):
+        """Shows the requested state and text, subject to throttling"""
+        if self._refresh_interval is None or (
+            state == ERROR and not self._throttle_errors
+        ):
+            self._cancel_refresh()
+            self._set_state(state,msg)
+            return
+
+        self._pending = (state,msg)
+        if self._refresh_id is None:
+            delay = self._last_refresh + self._refresh_interval - monotonic()
+            if delay > 0:
+                self._refresh_id = self.after(ceil(1000*delay),self._refresh)
+            else:
+                self._refresh_id = self.after_idle(self._refresh)
+
+    def _refresh(self):
+        """Applies the most recent throttled status request"""
+        self._refresh_id = None
+        if self._pending:
+            state,msg = self._pending
+            self._pending = None
+            self._last_refresh = monotonic()
+            self._set_state(state,msg)
+
+    def _cancel_effect(self):
+        """Cancels any pending auto-clear or flash effect"""
+        if self._effect is not None:
+            self._effect.cancel()
+            self._effect = None
+
+    def _flash(self,remaining):
+        """Toggles the warning appearance while flashing"""
+        if self._state == WARNING and self._pending is None:
+            state = WARNING if remaining % 2 == 0 else None
+            self._apply(self.options.kwargs(state))
+            remaining -= 1
+        elif not (self._pending or self.message_queue):
+            # the warning was never shown
+            remaining = -1
+        # (otherwise the warning is still waiting to be shown)
+        if remaining >= 0:
+            self._effect.reschedule(self.flash_interval)
+        else:
+            self._effect = None
+
+    def _cancel_refresh(self):
+        """Discards any pending throttled status request"""
+        self._pending = None
+        if self._refresh_id is not None:
+            self.after_cancel(self._refresh_id)
+            self._refresh_id = None
 
     def _set_state(self,state,msg):
-        if self._state != state:
+        if self._state == state:
+            self._apply(text=msg)
+        else:
             self._state = state
-            config = self.options.kwargs(state)
-            super().config(**config)
-        super().config(text=msg)
+            self._apply(self.options.kwargs(state),text=msg)
+
+    def _apply(self,config=None,**kwargs):
+        """Pushes the specified option values to the underlying tk.Label.
+        Only those values which differ from the values currently applied
+        are sent, all in a single configure call (if any are needed).
+        Within a batch block, the values are instead collected until the
+        block exits.
+        """
+        if config:
+            kwargs = {**config,**kwargs}
+        if self._batch_depth:
+            self._deferred.update(kwargs)
+            return
+        applied = self._applied
+        changes = {
+            key:value
+            for key,value in kwargs.items()
+            if key not in applied or (
+                value is not applied[key] and value != applied[key]
+            )
+        }
+        if changes:
+            super().configure(**changes)
+            applied.update(changes)
 
     def __getitem__(self,key):
         return self.cget(key)
 
     def __setitem__(self,key,value):
-        self.configure(key,value)
+        self.configure(**{key:value})
 
 
 
@@ -0,0 +1,166 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import tkinter as tk
+import weakref
+
+from .status_label import (
+    FontOption, Option, OptionError, Options, StatusStates, Synonym,
+    parse_key,
+)
+
+class StatusPalette:
+    """Named set of StatusLabel option values which can be applied to
+    any number of StatusLabel widgets at once (e.g. to switch a whole
+    dashboard between day and night colors).
+
+    A palette is specified in the same form as Options._defaults, i.e. a
+    dictionary keyed by status state (None for the values common to all
+    states) of dictionaries of option values, and/or as StatusLabel
+    keyword options (e.g. infobg="green").
+
+    A palette covers every option that it mentions in any state.  The
+    states it does not specify for a covered option take their built-in
+    defaults (from Options._defaults), so applying a palette replaces
+    all of the values of the options it covers while leaving all other
+    options untouched.
+
+    The palette is validated and resolved into per-state option values
+    once, when it is created.  The resulting options are built once per
+    Tk interpreter and shared (copy-on-write) by every StatusLabel to
+    which the palette is applied.  Applying a palette to a label costs a
+    single resolution of its current state and at most one Tk configure
+    call.
+    """
+
+    # named palettes
+    palettes = dict()
+
+    def __init__(self,name=None,states=None,**kwargs):
+        """StatusPalette constructor
+
+        Args:
+            name (str): if specified, the palette is registered under this
+                name (replacing any existing palette of that name)
+            states (dict): option values keyed by status state and option
+            kwargs: StatusLabel option values
+        Raises: OptionError if any option or state is not recognized
+        """
+        self.name = name
+
+        values = dict()     # option -> {state: value}
+        for state,options in (states or {}).items():
+            if state is not None and state not in StatusStates:
+                raise OptionError(f"Invalid state: {state}")
+            for key,value in options.items():
+                option,prefix = parse_key(key)
+                if prefix is not None:
+                    raise OptionError(f"Invalid {state} option: {key}")
+                self._add(values,option,state,value)
+        for key,value in kwargs.items():
+            option,state = parse_key(key)
+            self._add(values,option,state,value)
+
+        # resolved (option, state, value) for every state of every covered
+        # option, with the built-in defaults filling in the gaps
+        updates = list()
+        for option,specified in sorted(values.items()):
+            if option in FontOption.recognized_options():
+                states = StatusStates
+            else:
+                states = (None,*StatusStates)
+            for state in states:
+                try:
+                    value = specified[state]
+                except KeyError:
+                    value = Options._defaults.get(state,{}).get(option)
+                    if value is None and option in FontOption.recognized_options():
+                        value = False
+                updates.append((option,state,value))
+        self.updates = tuple(updates)
+
+        # option instances built from the updates, keyed by root window
+        self._options = weakref.WeakKeyDictionary()
+
+        if name is not None:
+            self.palettes[name] = self
+
+    @staticmethod
+    def _add(values,option,state,value):
+        """Validates and records a single palette option value"""
+        option = Synonym._synonym_map.get(option,option)
+        if option in FontOption.recognized_options():
+            if state is None:
+                raise OptionError(f"Invalid option: {option}")
+        elif option not in Option.recognized_options():
+            raise OptionError(f"Invalid option: {(state or '')+option}")
+        values.setdefault(option,dict())[state] = value
+
+    @classmethod
+    def named(cls,name):
+        """Returns the palette registered under the specified name
+
+        Raises: OptionError if there is no such palette
+        """
+        try:
+            return cls.palettes[name]
+        except KeyError:
+            raise OptionError(f"Unknown palette: {name}")
+
+    def options(self,root=None):
+        """Returns the (shared, read-only) option instances for the Tk
+        interpreter of the specified root window (default: the default
+        root), creating them the first time"""
+        root = root or tk._get_default_root()
+        try:
+            return self._options[root]
+        except KeyError:
+            pass
+
+        # the options start out as copies of the default options, so that
+        # their defaults (as reported by configure) are unchanged
+        prototype = Options._prototype(root)
+        options = dict()
+        for name,state,value in self.updates:
+            try:
+                option = options[name]
+            except KeyError:
+                option = options[name] = prototype[name].copy()
+            option.update(value,state)
+
+        self._options[root] = options
+        return options
+
+    def apply(self,labels):
+        """Applies the palette to each of the specified StatusLabels
+
+        Args:
+            labels (iterable): StatusLabel widgets
+        """
+        for label in labels:
+            label.options.share(self.options(label.options.root))
+            label._apply(label.options.kwargs(label.state))
+
+
+StatusPalette("default",Options._defaults)
+
+StatusPalette(
+    "night",
+    {
+        None: {"background":"#222", "foreground":"#ddd"},
+        "info": {"foreground":"#8cf"},
+        "warning": {"background":"#640", "foreground":"#fd8"},
+        "error": {"background":"#900", "foreground":"white"},
+    },
+)
+
+StatusPalette(
+    "high_contrast",
+    {
+        None: {"background":"white", "foreground":"black"},
+        "info": {"background":"#00c", "foreground":"white"},
+        "warning": {"background":"yellow", "foreground":"black", "bold":True},
+        "error": {"background":"black", "foreground":"yellow", "bold":True},
+    },
+)
@@ -0,0 +1,108 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import unittest
+
+import asyncio
+
+import tkinter as tk
+
+from mmtk import PlaceholderEntry, StatusLabel
+from mmtk.aio import TkDriver, entry_changes, flash
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.mw = tk.Tk()
+
+    def tearDown(self):
+        try:
+            self.mw.destroy()
+        except tk.TclError:
+            pass
+
+    def test_driver(self):
+        async def main():
+            driver = TkDriver(self.mw)
+            task = asyncio.create_task(driver.run())
+
+            fired = asyncio.Event()
+            self.mw.after(10,fired.set)
+            await asyncio.wait_for(fired.wait(),2)
+
+            driver.stop()
+            await asyncio.wait_for(task,2)
+
+        asyncio.run(main())
+
+    def test_driver_destroy(self):
+        async def main():
+            task = asyncio.create_task(TkDriver(self.mw).run())
+            await asyncio.sleep(0.01)
+            self.mw.destroy()
+            await asyncio.wait_for(task,2)
+
+        asyncio.run(main())
+
+    def test_flash(self):
+        sl = StatusLabel(self.mw)
+
+        async def main():
+            task = asyncio.create_task(sl.flash_error("oops",seconds=0.05))
+            await asyncio.sleep(0.01)
+            self.assertEqual(sl.state,"error")
+            self.assertEqual(sl.cget("text"),"oops")
+            await task
+            self.assertIsNone(sl.state)
+            self.assertEqual(sl.cget("text"),"")
+
+            # a newer status is left alone
+            task = asyncio.create_task(flash(sl,"warning","hmm",0.05))
+            await asyncio.sleep(0.01)
+            sl.info("newer")
+            await task
+            self.assertEqual(sl.state,"info")
+            self.assertEqual(sl.cget("text"),"newer")
+
+        asyncio.run(main())
+
+    def test_flash_destroyed(self):
+        sl = StatusLabel(self.mw)
+
+        async def main():
+            task = asyncio.create_task(sl.flash_error("oops",seconds=0.05))
+            await asyncio.sleep(0.01)
+            sl.destroy()
+            await task
+
+            sl2 = StatusLabel(self.mw)
+            task = asyncio.create_task(flash(sl2,"info","hi",0.05))
+            await asyncio.sleep(0.01)
+            self.mw.destroy()
+            await task
+
+        asyncio.run(main())
+
+    def test_entry_changes(self):
+        entry = PlaceholderEntry(self.mw,"placeholder")
+
+        async def main():
+            values = []
+            async def watch():
+                async for value in entry_changes(entry):
+                    values.append(value)
+
+            task = asyncio.create_task(watch())
+            await asyncio.sleep(0)
+
+            entry._handle_focus_in()
+            entry.insert(0,"abc")
+            entry.delete(0,"end")
+            entry._handle_focus_out()
+            self.assertEqual(entry.get(),"placeholder")
+
+            entry.destroy()
+            await asyncio.wait_for(task,1)
+            return values
+
+        self.assertEqual(asyncio.run(main()),["abc",""])
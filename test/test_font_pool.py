@@ -0,0 +1,52 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import unittest
+
+import tkinter as tk
+from tkinter.font import Font
+
+from mmtk.font_pool import FontPool
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.mw = tk.Tk()
+
+    def tearDown(self):
+        self.mw.destroy()
+
+    def test_acquire_release(self):
+        pool = FontPool()
+        attrs = {"family":"Courier","size":12,"slant":"italic"}
+
+        f1 = pool.acquire("italic",attrs,self.mw)
+        self.assertTrue(isinstance(f1,Font))
+        self.assertEqual(f1.actual("slant"),"italic")
+        self.assertEqual(pool.count(self.mw),1)
+
+        f2 = pool.acquire("italic",attrs,self.mw)
+        self.assertIs(f1,f2)
+        self.assertEqual(pool.count(self.mw),1)
+
+        f3 = pool.acquire("roman",{"family":"Courier"},self.mw)
+        self.assertIsNot(f1,f3)
+        self.assertEqual(pool.count(self.mw),2)
+
+        pool.release(f1,self.mw)
+        self.assertEqual(pool.count(self.mw),2)
+        pool.release(f2,self.mw)
+        self.assertEqual(pool.count(self.mw),1)
+        pool.release(f3,self.mw)
+        self.assertEqual(pool.count(self.mw),0)
+
+        with self.assertRaises(KeyError):
+            pool.release(f3,self.mw)
+
+    def test_default_root(self):
+        pool = FontPool()
+        font = pool.acquire("key",{"family":"Courier"})
+        self.assertEqual(pool.count(),1)
+        self.assertEqual(pool.count(self.mw),1)
+        pool.release(font)
+        self.assertEqual(pool.count(),0)
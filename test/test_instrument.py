@@ -0,0 +1,101 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import unittest
+
+import tkinter as tk
+
+from mmtk import PlaceholderEntry, StatusLabel
+from mmtk import instrument
+from mmtk.placeholder_entry import PlaceholderStyles
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.mw = tk.Tk()
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+        self.mw.destroy()
+
+    def test_recording(self):
+        sl = StatusLabel(self.mw)
+        phe = PlaceholderEntry(self.mw,"placeholder")
+
+        with instrument.recording() as rec:
+            self.assertTrue(instrument.is_enabled())
+            sl.info("hello")
+            sl.error("oops")
+            sl.configure(errorrelief="groove")
+            phe._handle_focus_in()
+            phe._handle_focus_out()
+
+        self.assertFalse(instrument.is_enabled())
+        stats = rec.stats()
+
+        sl_stats = stats[str(sl)]
+        self.assertEqual(sl_stats["info"]["calls"],1)
+        self.assertEqual(sl_stats["error"]["calls"],1)
+        self.assertEqual(sl_stats["_set_state"]["calls"],2)
+        self.assertEqual(sl_stats["_set_state"]["tcl_calls"],2)
+        self.assertEqual(sl_stats["info"]["tcl_calls"],0)
+        self.assertEqual(sl_stats["configure"]["tcl_calls"],1)
+        for record in sl_stats.values():
+            self.assertGreaterEqual(record["time"],record["tcl_time"])
+
+        phe_stats = stats[str(phe)]
+        self.assertEqual(phe_stats["_handle_focus_in"]["calls"],1)
+        self.assertEqual(phe_stats["_hide_placeholder"]["calls"],1)
+        self.assertGreater(phe_stats["_hide_placeholder"]["tcl_calls"],0)
+        self.assertEqual(phe_stats["_show_placeholder"]["calls"],1)
+
+        # nothing is recorded once disabled
+        sl.warning("not recorded")
+        self.assertEqual(instrument.stats(),stats)
+        self.assertNotIsInstance(sl.tk,instrument._TclCounter)
+
+    def test_variable_and_style_calls(self):
+        phe = PlaceholderEntry(self.mw,"placeholder")
+
+        with instrument.recording() as rec:
+            phe._handle_focus_in()
+            phe.insert(0,"abc")
+            self.assertEqual(phe.value,"abc")
+            # the style registry refreshes outside of any entry method
+            phe._handle_theme_changed()
+            self.mw.update()
+
+        stats = rec.stats()
+        # getvar is counted as well as call
+        self.assertGreater(
+            stats[str(phe)]["_handle_variable_write"]["tcl_calls"],0)
+        self.assertGreater(
+            stats["<PlaceholderStyles>"]["<other>"]["tcl_calls"],0)
+
+    def test_enable_disable(self):
+        info = StatusLabel.info
+        configure = StatusLabel.configure
+        entry_configure = PlaceholderEntry.configure
+        refresh = PlaceholderStyles.refresh
+
+        instrument.enable()
+        self.assertIsNot(StatusLabel.info,info)
+        self.assertIsNot(PlaceholderEntry.configure,entry_configure)
+
+        sl = StatusLabel(self.mw)
+        sl.info("counted")
+        sl.pack()
+        stats = instrument.stats()[str(sl)]
+        self.assertEqual(stats["info"]["calls"],1)
+        self.assertGreater(stats["<other>"]["tcl_calls"],0)
+
+        instrument.disable()
+        self.assertIs(StatusLabel.info,info)
+        self.assertIs(StatusLabel.configure,configure)
+        self.assertIs(PlaceholderEntry.configure,entry_configure)
+        self.assertNotIn("configure",PlaceholderEntry.__dict__)
+        self.assertIs(PlaceholderStyles.refresh,refresh)
+
+        instrument.reset()
+        self.assertEqual(instrument.stats(),{})
@@ -0,0 +1,151 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import unittest
+
+import tkinter as tk
+import time
+
+from mmtk.message_queue import MessageQueue
+from mmtk.status_label import OptionError, StatusLabel
+
+class Recorder:
+    """Stands in for a StatusLabel, recording the messages shown"""
+    def __init__(self,root):
+        self.root = root
+        self.shown = []
+
+    def _root(self):
+        return self.root
+
+    def _show_state(self,state,msg):
+        self.shown.append((state,msg))
+
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.mw = tk.Tk()
+        self.label = Recorder(self.mw)
+
+    def tearDown(self):
+        self.mw.destroy()
+
+    def run_until(self,done,timeout=2):
+        deadline = time.monotonic() + timeout
+        while not done() and time.monotonic() < deadline:
+            self.mw.update()
+            time.sleep(0.001)
+
+    def test_init(self):
+        queue = MessageQueue(self.label,{"error":1})
+        self.assertEqual(
+            queue.min_display,
+            {None:0,"info":0,"warning":0,"error":1},
+        )
+        with self.assertRaises(OptionError):
+            MessageQueue(self.label,{"bogus":1})
+        with self.assertRaises(ValueError):
+            MessageQueue(self.label,{"error":1},maxlen=0)
+
+    def test_min_display(self):
+        queue = MessageQueue(self.label,{"error":0.1,"info":0.02})
+        queue.post("error","first")
+        for i in range(5):
+            queue.post("info",f"info {i}")
+        # the error stays up, the newest info is queued
+        self.assertEqual(self.label.shown,[("error","first")])
+        self.assertEqual(len(queue),1)
+        self.assertEqual(queue.dropped,4)
+
+        start = time.monotonic()
+        self.run_until(lambda: len(self.label.shown) > 1)
+        self.assertGreaterEqual(time.monotonic() - start,0.09)
+        self.assertEqual(self.label.shown[1:],[("info","info 4")])
+        self.assertFalse(queue)
+
+    def test_priority(self):
+        queue = MessageQueue(self.label,{"info":0.05,"warning":0.05})
+        queue.post("info","shown")
+        queue.post("info","queued info")
+        queue.post(None,"queued clear")
+        queue.post("warning","preempts")
+        queue.post("warning","queued warning")
+        queue.post("error","preempts too")
+        self.assertEqual(
+            self.label.shown,
+            [("info","shown"),("warning","preempts"),("error","preempts too")],
+        )
+        self.run_until(lambda: not queue)
+        self.assertEqual(
+            self.label.shown[3:],
+            [
+                ("warning","queued warning"),
+                ("info","queued info"),
+                (None,"queued clear"),
+            ],
+        )
+
+    def test_maxlen(self):
+        queue = MessageQueue(self.label,{"error":10},maxlen=2)
+        queue.post("error","shown")
+        queue.post("info","a")
+        queue.post("warning","b")
+        # the newer info replaces the queued one
+        queue.post("info","c")
+        self.assertEqual(queue.dropped,1)
+        self.assertEqual(len(queue),2)
+        # full: the clear is less important than any queued message
+        queue.post(None,"d")
+        self.assertEqual(queue.dropped,2)
+        # the least severe message is evicted
+        queue.post("error","e")
+        self.assertEqual(queue.dropped,3)
+        self.assertEqual(len(queue),2)
+
+        queue.min_display["error"] = 0
+        queue._until = 0
+        queue._release()
+        self.run_until(lambda: not queue)
+        self.assertEqual(
+            [msg for _,msg in self.label.shown],
+            ["shown","e","b"],
+        )
+
+    def test_flood(self):
+        queue = MessageQueue(self.label,{"error":10},maxlen=50)
+        queue.post("error","shown")
+        for i in range(10000):
+            queue.post("info",f"info {i}")
+            queue.post("warning",f"warning {i}")
+        self.assertEqual(len(queue),2)
+        self.assertEqual(queue.dropped,19998)
+        # dead entries do not accumulate
+        self.assertLess(len(queue._best) + len(queue._worst),4*2 + 32 + 2)
+        queue.close()
+        self.assertEqual(len(queue),0)
+
+    def test_flood_shows_newest(self):
+        queue = MessageQueue(self.label,{"info":0.02})
+        queue.post("info","shown")
+        for i in range(1000):
+            queue.post("info",f"info {i}")
+        self.run_until(lambda: not queue)
+        self.assertEqual(
+            self.label.shown,
+            [("info","shown"),("info","info 999")],
+        )
+
+    def test_status_label(self):
+        sl = StatusLabel(self.mw,min_display={"error":0.05})
+        self.assertIsNone(StatusLabel(self.mw).message_queue)
+        sl.error("read me")
+        sl.info("later")
+        self.assertEqual(sl.state,"error")
+        self.assertEqual(sl.cget("text"),"read me")
+        self.run_until(lambda: sl.state == "info")
+        self.assertEqual(sl.cget("text"),"later")
+        sl.destroy()
+
+if __name__ == '__main__':
+    unittest.main()
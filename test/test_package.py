@@ -0,0 +1,52 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import os
+import subprocess
+import sys
+import unittest
+
+import mmtk
+
+class Tests(unittest.TestCase):
+    def run_python(self,code):
+        root = os.path.join(os.path.dirname(__file__),"..")
+        result = subprocess.run(
+            [sys.executable,"-c",code],
+            cwd=root,capture_output=True,text=True,check=True,
+        )
+        return result.stdout.split()
+
+    def test_lazy_import(self):
+        loaded = self.run_python(
+            "import sys, mmtk\n"
+            "print(*(m for m in ('tkinter','mmtk.status_label',"
+            "'mmtk.placeholder_entry','mmtk.status_channel') "
+            "if m in sys.modules))"
+        )
+        self.assertEqual(loaded,[])
+
+        loaded = self.run_python(
+            "import sys, mmtk\n"
+            "mmtk.StatusLabel\n"
+            "print(*(m for m in ('mmtk.status_label','mmtk.placeholder_entry') "
+            "if m in sys.modules))"
+        )
+        self.assertEqual(loaded,["mmtk.status_label"])
+
+    def test_public_names(self):
+        from mmtk.placeholder_entry import PlaceholderEntry
+        from mmtk.status_label import StatusLabel
+        from mmtk.status_channel import StatusChannel
+        self.assertIs(mmtk.PlaceholderEntry,PlaceholderEntry)
+        self.assertIs(mmtk.StatusLabel,StatusLabel)
+        self.assertIs(mmtk.StatusChannel,StatusChannel)
+        self.assertIsInstance(mmtk.version,str)
+        for name in mmtk.__all__:
+            self.assertIn(name,dir(mmtk))
+        with self.assertRaises(AttributeError):
+            mmtk.NoSuchWidget
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,12 +3,14 @@
 # License: UNLICENSE (http://unlicense.org)
 
 import unittest
+import unittest.mock
 
 import tkinter as tk
 from tkinter import ttk
 from tkinter import font
 
 from mmtk import PlaceholderEntry
+from mmtk.placeholder_entry import placeholder_styles, _placeholder_fonts
 
 class Tests(unittest.TestCase):
     def setUp(self):
@@ -200,27 +202,218 @@ class Tests(unittest.TestCase):
         self.assertTrue(phe.showing_placeholder)
         self.assertEqual(phe.get(),placeholder)
 
+    def test_overlay_mode(self):
+        placeholder = "TestString"
+        phe = PlaceholderEntry(self.mw,placeholder,placeholder_mode="overlay")
+        phe.pack()
+        self.mw.update()
 
+        # the entry itself is never modified
+        self.assertEqual(phe.get(),'')
+        self.assertIsNone(phe.placeholder_style)
+        self.assertTrue(str(phe['textvariable']))
+        self.assertTrue(phe.showing_placeholder)
+        self.assertTrue(phe._overlay.winfo_ismapped())
+        self.assertEqual(phe._overlay['text'],placeholder)
+        self.assertEqual(phe._overlay['foreground'],phe.placeholder_color)
 
+        phe._handle_focus_in()
+        self.mw.update()
+        self.assertFalse(phe.showing_placeholder)
+        self.assertFalse(phe._overlay.winfo_ismapped())
+        self.assertEqual(phe.get(),'')
 
+        phe.insert(0,"some text")
+        phe._handle_focus_out()
+        self.assertFalse(phe.showing_placeholder)
+        self.assertEqual(phe.get(),"some text")
 
+        # emptiness follows the textvariable, even without focus changes
+        phe.delete(0,'end')
+        self.assertTrue(phe.showing_placeholder)
+        phe.setvar(str(phe['textvariable']),"set")
+        self.assertFalse(phe.showing_placeholder)
+        self.assertEqual(phe.get(),"set")
+
+        with self.assertRaises(ValueError):
+            PlaceholderEntry(self.mw,placeholder,placeholder_mode="bogus")
+
+    def test_overlay_focus_calls(self):
+        phe = PlaceholderEntry(self.mw,"overlay",placeholder_mode="overlay")
+        phe.insert(0,"text")
+        calls = list()
+        tcl = phe.tk
+        class Counter:
+            def __getattr__(self,name):
+                return getattr(tcl,name)
+            def call(self,*args):
+                calls.append(args)
+                return tcl.call(*args)
+        phe.tk = Counter()
+        try:
+            # a non-empty entry needs no Tk calls at all on focus changes
+            for i in range(10):
+                phe._handle_focus_in()
+                phe._handle_focus_out()
+        finally:
+            phe.tk = tcl
+        self.assertEqual(calls,[])
+
+    def test_overlay_textvariable(self):
+        var = tk.StringVar(self.mw,value="initial")
+        phe = PlaceholderEntry(
+            self.mw,"overlay",textvariable=var,placeholder_mode="overlay"
+        )
+        self.assertEqual(str(phe['textvariable']),str(var))
+        self.assertFalse(phe.showing_placeholder)
+        var.set('')
+        self.assertTrue(phe.showing_placeholder)
 
+        # the trace is removed when the entry is destroyed
+        phe.destroy()
+        var.set("after")
+        self.assertEqual(var.trace_info(),[])
+
+    def test_value(self):
+        for mode in PlaceholderEntry.placeholder_modes:
+            phe = PlaceholderEntry(self.mw,"placeholder",placeholder_mode=mode)
+            self.assertEqual(phe.value,'')
+            self.assertTrue(phe.showing_placeholder)
+
+            phe._handle_focus_in()
+            phe.insert(0,"abc")
+            self.assertEqual(phe.value,"abc")
+            phe._handle_focus_out()
+            self.assertEqual(phe.value,"abc")
+
+            phe.delete(0,'end')
+            phe._handle_focus_out()
+            self.assertTrue(phe.showing_placeholder)
+            self.assertEqual(phe.value,'')
+
+            # the placeholder itself can be typed in as a value
+            phe._handle_focus_in()
+            phe.insert(0,"placeholder")
+            self.assertEqual(phe.value,"placeholder")
+
+    def test_value_no_tcl_calls(self):
+        phe = PlaceholderEntry(self.mw,"placeholder")
+        phe.insert(0,"abc")
+        with unittest.mock.patch.object(phe,"tk") as mock_tk:
+            self.assertEqual(phe.value,"abc")
+        mock_tk.call.assert_not_called()
+
+    def test_change_callbacks(self):
+        values = list()
+        phe = PlaceholderEntry(self.mw,"placeholder")
+        phe.add_change_callback(values.append)
+
+        # showing/hiding the placeholder is not a change
+        phe._handle_focus_in()
+        phe._handle_focus_out()
+        self.assertEqual(values,[])
 
+        phe._handle_focus_in()
+        phe.insert(0,"abc")
+        phe.delete(0,'end')
+        phe._handle_focus_out()
+        self.assertEqual(values,["abc",""])
 
-        
-
-
-
-
-
-
+        phe.remove_change_callback(values.append)
+        phe.insert(0,"xyz")
+        self.assertEqual(values,["abc",""])
 
+    def test_shared_placeholder_style(self):
+        phe1 = PlaceholderEntry(self.mw,"one")
+        phe2 = PlaceholderEntry(self.mw,"two")
+        self.assertEqual(phe1.placeholder_style,phe2.placeholder_style)
 
+        phe3 = PlaceholderEntry(self.mw,"three",placeholder_color="green")
+        self.assertNotEqual(phe1.placeholder_style,phe3.placeholder_style)
 
+        styles = placeholder_styles(self.mw)
+        created = styles.created
+        self.assertEqual(styles.styles[None][1],2)
 
+        # style names are recycled once they are no longer in use
+        green_style = phe3.placeholder_style
+        phe3.destroy()
+        self.assertNotIn("green",styles.styles)
 
+        phe4 = PlaceholderEntry(self.mw,"four",placeholder_color="blue")
+        self.assertEqual(phe4.placeholder_style,green_style)
+        self.assertEqual(styles.created,created)
 
-        
+        s = ttk.Style()
+        self.assertEqual(s.lookup(phe4.placeholder_style,'foreground'),"blue")
 
+        phe1.destroy()
+        self.assertEqual(styles.styles[None][1],1)
+        self.assertEqual(
+            s.lookup(phe2.placeholder_style,'foreground'),
+            phe2.placeholder_color
+        )
 
+    def expected_placeholder_color(self):
+        s = ttk.Style()
+        fg = self.mw.winfo_rgb(s.lookup('TEntry','foreground'))
+        bg = self.mw.winfo_rgb(s.lookup('TEntry','background'))
+        return '#' + ''.join(
+            f"{(2*(f//256)+(b//256))//3:02x}" for f,b in zip(fg,bg)
+        )
 
+    def test_theme_change(self):
+        s = ttk.Style()
+        themes = [t for t in s.theme_names() if t != s.theme_use()]
+        if not themes:
+            self.skipTest("only one ttk theme available")
+
+        phe = PlaceholderEntry(self.mw,"default color")
+        green = PlaceholderEntry(self.mw,"green",placeholder_color="green")
+        self.mw.update()
+
+        styles = placeholder_styles(self.mw)
+        with unittest.mock.patch.object(
+            styles,"refresh",wraps=styles.refresh
+        ) as mock_refresh:
+            s.theme_use(themes[0])
+            self.mw.update()
+            self.mw.update()
+            # a single refresh serves all of the entries
+            self.assertLessEqual(mock_refresh.call_count,2)
+
+        expected = self.expected_placeholder_color()
+        self.assertEqual(phe.placeholder_color,expected)
+        self.assertEqual(s.lookup(phe.placeholder_style,'foreground'),expected)
+        self.assertEqual(s.lookup(green.placeholder_style,'foreground'),"green")
+
+    def test_shared_placeholder_font(self):
+        def font_count():
+            return len(self.mw.tk.splitlist(self.mw.tk.call("font","names")))
+
+        first = PlaceholderEntry(self.mw,"first")
+        fonts = font_count()
+        pooled = _placeholder_fonts.count(self.mw)
+
+        entries = [PlaceholderEntry(self.mw,f"entry {i}") for i in range(100)]
+        for phe in entries:
+            self.assertIs(phe.placeholder_font,first.placeholder_font)
+        self.assertEqual(font_count(),fonts)
+        self.assertEqual(_placeholder_fonts.count(self.mw),pooled)
+
+        # font dictionaries are shared as well
+        attr = {"family":"Courier","size":14}
+        courier = [
+            PlaceholderEntry(self.mw,"courier",placeholder_font=dict(attr))
+            for i in range(10)
+        ]
+        self.assertIs(courier[0].placeholder_font,courier[-1].placeholder_font)
+        self.assertEqual(_placeholder_fonts.count(self.mw),pooled+1)
+
+        # and released once no entry uses them
+        for phe in courier:
+            phe.destroy()
+        self.assertEqual(_placeholder_fonts.count(self.mw),pooled)
+        for phe in (first,*entries):
+            phe.destroy()
+        self.assertEqual(_placeholder_fonts.count(self.mw),0)
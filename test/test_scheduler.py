@@ -0,0 +1,124 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import unittest
+
+import gc
+import tkinter as tk
+import time
+import weakref
+
+from mmtk.scheduler import TimerWheel, scheduler, _schedulers
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.mw = tk.Tk()
+        self.start = time.monotonic()
+        self.calls = []
+
+    def tearDown(self):
+        self.mw.destroy()
+
+    def callback(self,name):
+        self.calls.append((name,time.monotonic() - self.start))
+
+    def run_until(self,done,timeout=2):
+        deadline = time.monotonic() + timeout
+        while not done() and time.monotonic() < deadline:
+            self.mw.update()
+            time.sleep(0.001)
+
+    def test_shared(self):
+        frame = tk.Frame(self.mw)
+        wheel = scheduler(self.mw)
+        self.assertIs(scheduler(frame),wheel)
+        self.assertIs(wheel.master,self.mw)
+
+    def test_root_destroy(self):
+        root = tk.Tk()
+        label = tk.Label(root)
+        wheel = scheduler(label)
+        timer = wheel.schedule(10,label.destroy)
+        self.assertIn(root,_schedulers)
+
+        root.destroy()
+        self.assertFalse(timer.pending)
+        self.assertEqual(len(wheel),0)
+        self.assertNotIn(root,_schedulers)
+
+        # the wheel does not keep the destroyed root alive
+        ref = weakref.ref(root)
+        del root,label,timer
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertIsNone(wheel.master)
+
+    def test_schedule(self):
+        wheel = TimerWheel(self.mw,tick=0.01,slots=8)
+        wheel.schedule(0.05,self.callback,"a")
+        wheel.schedule(0.02,self.callback,"b")
+        # longer than a full turn of the wheel
+        wheel.schedule(0.15,self.callback,"c")
+        self.assertEqual(len(wheel),3)
+
+        self.run_until(lambda: len(self.calls) == 3)
+        self.assertEqual([name for name,_ in self.calls],["b","a","c"])
+        for (name,elapsed),delay in zip(self.calls,(0.02,0.05,0.15)):
+            self.assertGreaterEqual(elapsed,delay)
+        self.assertEqual(len(wheel),0)
+
+        # the tick stops when there is nothing left to do
+        self.assertFalse(wheel._active)
+
+    def test_cancel_reschedule(self):
+        wheel = TimerWheel(self.mw,tick=0.01,slots=8)
+        a = wheel.schedule(0.02,self.callback,"a")
+        b = wheel.schedule(0.02,self.callback,"b")
+        c = wheel.schedule(0.03,self.callback,"c")
+        self.assertTrue(a.pending)
+        a.cancel()
+        self.assertFalse(a.pending)
+        a.cancel()
+        b.reschedule(0.05)
+        self.assertEqual(len(wheel),2)
+
+        self.run_until(lambda: len(self.calls) == 2)
+        self.assertEqual([name for name,_ in self.calls],["c","b"])
+        self.assertGreaterEqual(self.calls[1][1],0.05)
+        self.assertFalse(b.pending)
+
+        # timers may be rescheduled after being called
+        b.reschedule(0.01)
+        self.run_until(lambda: len(self.calls) == 3)
+        self.assertEqual(self.calls[2][0],"b")
+
+    def test_callbacks(self):
+        wheel = TimerWheel(self.mw,tick=0.01,slots=8)
+
+        # a callback may cancel another timer due on the same tick
+        wheel.schedule(0.02,lambda: b.cancel())
+        b = wheel.schedule(0.02,self.callback,"b")
+        # or schedule a new one
+        wheel.schedule(0.02,wheel.schedule,0.02,self.callback,"c")
+        # exceptions are reported without stopping the other timers
+        errors = []
+        self.mw.report_callback_exception = lambda *args: errors.append(args)
+        wheel.schedule(0.01,lambda: 1/0)
+
+        self.run_until(lambda: self.calls)
+        self.assertEqual(len(errors),1)
+        self.assertIs(errors[0][0],ZeroDivisionError)
+        self.assertEqual([name for name,_ in self.calls],["c"])
+
+    def test_stop(self):
+        wheel = TimerWheel(self.mw,tick=0.01,slots=8)
+        timers = [wheel.schedule(0.02,self.callback,i) for i in range(5)]
+        wheel.stop()
+        self.assertEqual(len(wheel),0)
+        self.assertFalse(any(timer.pending for timer in timers))
+        self.run_until(lambda: False,0.05)
+        self.assertEqual(self.calls,[])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import unittest
+
+import threading
+import time
+
+import tkinter as tk
+
+from mmtk import StatusChannel, StatusLabel
+from mmtk.status_label import OptionError
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.mw = tk.Tk()
+
+    def tearDown(self):
+        self.mw.destroy()
+
+    def test_post_and_drain(self):
+        channel = StatusChannel(self.mw)
+        sl = StatusLabel(self.mw,channel=channel)
+
+        sl.post("info","one")
+        channel.post(sl,"warning","two")
+        self.assertIsNone(sl.state)
+
+        self.assertEqual(channel.drain(),1)
+        self.assertEqual(sl.state,"warning")
+        self.assertEqual(sl.cget("text"),"two")
+
+        stats = channel.stats()
+        self.assertEqual(stats["posted"],2)
+        self.assertEqual(stats["received"],2)
+        self.assertEqual(stats["delivered"],1)
+        self.assertEqual(stats["coalesced"],1)
+        self.assertEqual(stats["dropped"],0)
+        self.assertEqual(stats["queued"],0)
+        self.assertGreaterEqual(stats["max_latency"],stats["mean_latency"])
+
+        sl.post(None,"cleared")
+        self.assertEqual(channel.drain(),1)
+        self.assertIsNone(sl.state)
+        self.assertEqual(sl.cget("text"),"cleared")
+
+    def test_periodic_drain(self):
+        channel = StatusChannel(self.mw,interval=5)
+        sl = StatusLabel(self.mw,channel=channel)
+        sl.post("error","oops")
+
+        deadline = time.monotonic() + 5
+        while sl.state is None and time.monotonic() < deadline:
+            self.mw.update()
+            time.sleep(0.001)
+        self.assertEqual(sl.state,"error")
+
+        channel.close()
+        sl.post("info","never shown")
+        self.assertEqual(channel.stats()["queued"],1)
+
+    def test_exceptions(self):
+        channel = StatusChannel(self.mw)
+        sl = StatusLabel(self.mw,channel=channel)
+        with self.assertRaises(OptionError):
+            sl.post("junk","not a state")
+
+        sl = StatusLabel(self.mw)
+        with self.assertRaises(RuntimeError):
+            sl.post("info","no channel")
+
+    def test_overflow(self):
+        channel = StatusChannel(self.mw,maxlen=10)
+        sl = StatusLabel(self.mw,channel=channel)
+        for i in range(25):
+            sl.post("info",f"update {i}")
+        channel.drain()
+
+        self.assertEqual(sl.cget("text"),"update 24")
+        stats = channel.stats()
+        self.assertEqual(stats["posted"],25)
+        self.assertEqual(stats["dropped"],15)
+        self.assertEqual(stats["coalesced"],9)
+        self.assertEqual(stats["delivered"],1)
+
+    def test_destroyed_label(self):
+        channel = StatusChannel(self.mw)
+        sl = StatusLabel(self.mw,channel=channel)
+        sl.post("info","too late")
+        sl.destroy()
+        channel.drain()
+        self.assertEqual(channel.stats()["discarded"],1)
+
+    def test_bounded_drain(self):
+        channel = StatusChannel(self.mw)
+        sl = StatusLabel(self.mw,channel=channel)
+
+        # a producer which posts as fast as the queue is drained
+        queue = channel._queue
+        popleft = queue.popleft
+        class Producer:
+            def __len__(self):
+                return len(queue)
+            def append(self,update):
+                queue.append(update)
+            def popleft(self):
+                update = popleft()
+                channel.post(sl,"info",f"more {update[0]}")
+                return update
+        channel._queue = Producer()
+
+        for i in range(10):
+            sl.post("info",f"update {i}")
+        self.assertEqual(channel.drain(),1)
+        self.assertEqual(sl.cget("text"),"update 9")
+        self.assertEqual(channel.stats()["received"],10)
+        self.assertEqual(len(queue),10)
+
+    def test_threaded_producers(self):
+        channel = StatusChannel(self.mw)
+        labels = [StatusLabel(self.mw,channel=channel) for _ in range(4)]
+
+        def produce(thread):
+            for i in range(1000):
+                label = labels[i%len(labels)]
+                label.post("info",f"{thread}:{i}")
+
+        threads = [
+            threading.Thread(target=produce,args=(t,)) for t in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            channel.drain()
+            self.mw.update()
+        for thread in threads:
+            thread.join()
+        channel.drain()
+
+        stats = channel.stats()
+        self.assertEqual(stats["posted"],16000)
+        self.assertEqual(stats["received"],16000)
+        self.assertEqual(stats["dropped"],0)
+        self.assertEqual(
+            stats["delivered"] + stats["coalesced"],
+            stats["received"],
+        )
+
+        final = {f"{t}:{i}" for t in range(16) for i in range(996,1000)}
+        for label in labels:
+            self.assertIn(label.cget("text"),final)
@@ -0,0 +1,87 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import unittest
+import time
+
+from mmtk.status_history import StatusHistory
+from mmtk.status_label import OptionError
+
+class Tests(unittest.TestCase):
+    def test_init(self):
+        history = StatusHistory(5)
+        self.assertEqual(history.size,5)
+        self.assertEqual(len(history),0)
+        self.assertEqual(history.last(3),[])
+        self.assertEqual(list(history),[])
+        with self.assertRaises(ValueError):
+            StatusHistory(0)
+
+    def test_append(self):
+        history = StatusHistory(5)
+        before = time.time()
+        history.append("info","hello")
+        after = time.time()
+
+        self.assertEqual(len(history),1)
+        (timestamp,state,text), = history.last()
+        self.assertTrue(before <= timestamp <= after)
+        self.assertEqual((state,text),("info","hello"))
+
+        history.append(None,"cleared",timestamp=12.5)
+        self.assertEqual(history.last(),[(12.5,None,"cleared")])
+
+        with self.assertRaises(OptionError):
+            history.append("bogus","text")
+        with self.assertRaises(OptionError):
+            history.append([],"text")
+        self.assertEqual(len(history),2)
+
+    def test_ring_buffer(self):
+        history = StatusHistory(4)
+        states = (None,"info","warning","error")
+        for i in range(10):
+            history.append(states[i%4],f"msg {i}",timestamp=float(i))
+
+        self.assertEqual(len(history),4)
+        self.assertEqual(
+            list(history),
+            [(float(i),states[i%4],f"msg {i}") for i in range(6,10)],
+        )
+        self.assertEqual(
+            [text for _,_,text in history.last(2)],
+            ["msg 8","msg 9"],
+        )
+        self.assertEqual(len(history.last(100)),4)
+        self.assertEqual(history.last(0),[])
+
+        history.clear()
+        self.assertEqual(len(history),0)
+        self.assertEqual(list(history),[])
+
+    def test_queries(self):
+        history = StatusHistory(8)
+        states = ("info","warning","error","info","info",None)
+        for i,state in enumerate(states):
+            history.append(state,f"msg {i}",timestamp=float(i))
+
+        self.assertEqual(
+            [text for _,_,text in history.by_state("info")],
+            ["msg 0","msg 3","msg 4"],
+        )
+        self.assertEqual(history.by_state(None),[(5.0,None,"msg 5")])
+        self.assertEqual(history.by_state("error"),[(2.0,"error","msg 2")])
+        with self.assertRaises(OptionError):
+            history.by_state("bogus")
+
+        self.assertEqual(
+            [text for _,_,text in history.since(3.5)],
+            ["msg 4","msg 5"],
+        )
+        self.assertEqual(len(history.since(3.0)),3)
+        self.assertEqual(len(history.since(0.0)),6)
+        self.assertEqual(history.since(10.0),[])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,8 @@ from unittest.mock import MagicMock
 import tkinter as tk
 from tkinter.font import Font
 import re
+import time
+import weakref
 from numbers import Number
 
 from mmtk.status_label import (
@@ -22,10 +24,30 @@ from mmtk.status_label import (
 from mmtk.status_label import (
     OptionError,
     parse_key,
+    inherited_config,
+    reload_option_database,
+    _derived_fonts,
 )
 
 from copy import deepcopy
 
+class TclCallCounter:
+    """Stands in for a widget's Tcl interpreter, counting the calls
+    made through it and the number of arguments passed to those calls"""
+    def __init__(self,tk):
+        self._tk = tk
+        self.calls = 0
+        self.args = 0
+
+    def call(self,*args):
+        self.calls += 1
+        self.args += len(args[0] if len(args) == 1 else args)
+        return self._tk.call(*args)
+
+    def __getattr__(self,name):
+        return getattr(self._tk,name)
+
+
 class TestOptionClasses(unittest.TestCase):
 
     def setUp(self):
@@ -66,6 +88,24 @@ class TestOptionClasses(unittest.TestCase):
         with self.assertRaises(OptionError):
             result = parse_key({1:1,2:3,3:"cat"})
 
+    def test_parse_key_table(self):
+        options = (
+            *Option.recognized_options(),
+            *FontOption.recognized_options(),
+            *Synonym.recognized_synonyms(),
+        )
+        for option in options:
+            self.assertEqual(parse_key(option),(option,None))
+            for state in self.states:
+                self.assertEqual(parse_key(state+option),(option,state))
+                self.assertEqual(parse_key(state+"_"+option),(option,state))
+
+        # unrecognized keys are still split on the state prefix
+        self.assertEqual(parse_key("info_junk"),("junk","info"))
+        self.assertEqual(parse_key("errortext"),("text","error"))
+        self.assertEqual(parse_key("warning"),("","warning"))
+        self.assertEqual(parse_key("junk"),("junk",None))
+
 
     def test_synonym_config_entry(self):
         synonyms = {
@@ -348,6 +388,38 @@ class TestOptionClasses(unittest.TestCase):
             opt = Option("background")
             opt.update("red","fly")
 
+    def test_option_storage(self):
+        opt = Option("background",info="green")
+        font_opt = FontOption("bold",error=True)
+        syn = Synonym("bg",{"background":opt})
+        for obj in (opt,font_opt,syn):
+            self.assertFalse(hasattr(obj,"__dict__"))
+
+        self.assertEqual(
+            opt.values,
+            {None:None,"info":"green","warning":None,"error":None},
+        )
+        self.assertEqual(
+            font_opt.values,
+            {"info":False,"warning":False,"error":True},
+        )
+
+        # copies are independent of the original
+        copy = opt.copy()
+        self.assertIs(type(copy),Option)
+        copy.update("red","info")
+        self.assertEqual(copy.value("info"),"red")
+        self.assertEqual(opt.value("info"),"green")
+        self.assertEqual(copy.config_entry(),opt.config_entry())
+
+        copy = font_opt.copy()
+        self.assertIs(type(copy),FontOption)
+        copy.update(True,"info")
+        self.assertEqual(copy.config_entry("info")[3:],(False,True))
+        self.assertEqual(font_opt.config_entry("info")[3:],(False,False))
+        with self.assertRaises(OptionError):
+            copy.value(None)
+
 
 class TestOptions (unittest.TestCase):
     @classmethod
@@ -386,14 +458,19 @@ class TestOptions (unittest.TestCase):
             mock_init_calls.add(n)
             s.name = n
 
+        # (the option instances are created once and then shared)
         with (
             patch.object(Option,"__init__",mock_init),
             patch.object(FontOption,"__init__",mock_init),
             patch.object(Synonym,"__init__",mock_init),
             patch.object(Options,"configure") as mock_configure,
+            patch.object(Options,"_prototypes",weakref.WeakKeyDictionary()),
         ):
             options = Options()
             self.assertEqual(mock_init_calls, self.base_options)
+            mock_init_calls.clear()
+            options = Options()
+            self.assertEqual(mock_init_calls, set())
 
         #verify that the builtins are set correctly
         options = Options()
@@ -435,6 +512,27 @@ class TestOptions (unittest.TestCase):
             else:
                 self.assertEqual(len(config),5)
 
+    def test_configure_dump_cache(self):
+        options = Options()
+        result = options.configure()
+        self.assertIs(options.configure(),result)
+        with self.assertRaises(TypeError):
+            result["infobg"] = ("infobg","-infobackground")
+
+        options.configure(infobg="green")
+        updated = options.configure()
+        self.assertIsNot(updated,result)
+        self.assertEqual(updated["infobackground"][-1],"green")
+        self.assertNotEqual(result["infobackground"][-1],"green")
+        self.assertIs(options.configure(),updated)
+
+        # copies start out sharing the dump
+        copy = options.copy()
+        self.assertIs(copy.configure(),updated)
+        copy.configure(relief="ridge")
+        self.assertEqual(copy.configure()["relief"][-1],"ridge")
+        self.assertIs(options.configure(),updated)
+
     def test_configure_query_option(self):
         options = Options()
         syn = "|".join(Synonym.recognized_synonyms())
@@ -585,6 +683,68 @@ class TestOptions (unittest.TestCase):
                 else:
                     self.assertEqual(v,options.cget(state+k))
 
+    def test_kwargs_cache(self):
+        options = Options()
+        kwargs = {state:options.kwargs(state) for state in (None,*self.states)}
+
+        # repeated calls are served from the cache
+        with patch.object(Options,"cget") as mock_cget:
+            for state,expected in kwargs.items():
+                self.assertIs(options.kwargs(state),expected)
+            self.assertIs(options.kwargs(""),kwargs[None])
+            self.assertEqual(mock_cget.call_count,0)
+
+        # only the modified state is invalidated
+        options.configure(errorbg="blue")
+        self.assertEqual(options.kwargs("error")["background"],"blue")
+        for state in (None,"info","warning"):
+            self.assertIs(options.kwargs(state),kwargs[state])
+
+        # modifying the common value invalidates all states
+        options.configure(relief="groove")
+        for state in (None,*self.states):
+            self.assertIsNot(options.kwargs(state),kwargs[state])
+            self.assertEqual(options.kwargs(state)["relief"],"groove")
+
+        with self.assertRaises(OptionError):
+            options.kwargs("junk")
+
+    def test_copy_on_write(self):
+        a = Options()
+        b = Options()
+        for name,option in a.options.items():
+            self.assertIs(b.options[name],option)
+
+        # only the modified option (and its synonym) is copied
+        b.configure(infobg="green")
+        self.assertEqual(b.cget("infobackground"),"green")
+        self.assertNotEqual(a.cget("infobackground"),"green")
+        for name,option in a.options.items():
+            if name in ("background","bg"):
+                self.assertIsNot(b.options[name],option)
+            else:
+                self.assertIs(b.options[name],option)
+        self.assertIs(b.options["bg"].target,b.options["background"])
+
+        # the copy is made only once
+        background = b.options["background"]
+        b.configure(errorbackground="blue",warningbold=True)
+        self.assertIs(b.options["background"],background)
+        self.assertEqual(b.cget("infobg"),"green")
+        self.assertEqual(b.cget("errorbg"),"blue")
+        self.assertEqual(Options().cget("warningbold"),False)
+
+        # copies share options until either is modified
+        c = b.copy()
+        self.assertIs(c.options["background"],background)
+        self.assertEqual(c.cget("infobg"),"green")
+        c.configure(infobg="red")
+        b.configure(errorbg="black")
+        self.assertEqual(b.cget("infobg"),"green")
+        self.assertEqual(b.cget("errorbg"),"black")
+        self.assertEqual(c.cget("infobg"),"red")
+        self.assertEqual(c.cget("errorbg"),"blue")
+
 
 class TestStatusLabel(unittest.TestCase):
     def setUp(self):
@@ -652,6 +812,364 @@ class TestStatusLabel(unittest.TestCase):
         self.assertEqual(sl.text,ok)
         self.assertEqual(sl.cget("text"),ok)
 
+    def test_inherited_config_cache(self):
+        ref_config = tk.Label(self.mw).configure()
+        for option in Option.recognized_options():
+            self.assertEqual(inherited_config(option), ref_config[option])
+
+        # no probe widgets are left behind
+        children = len(self.mw.winfo_children())
+        sl = StatusLabel(self.mw)
+        Options()
+        self.assertEqual(len(self.mw.winfo_children()), children + 1)
+
+        # and no new probes are created once the cache is filled
+        with patch.object(tk.Label,"configure") as mock_configure:
+            Options()
+            self.assertEqual(mock_configure.call_count,0)
 
+    def test_option_database(self):
+        self.mw.option_add("*StatusLabel.background","white")
+        self.mw.option_add("*StatusLabel.warningBackground","orange")
+        self.mw.option_add("*StatusLabel.errorBold","false")
 
+        sl = StatusLabel(self.mw)
+        self.assertEqual(sl.winfo_class(),"StatusLabel")
+        self.assertEqual(str(sl.cget("background")),"white")
+        self.assertEqual(sl.cget("warningbg"),"orange")
+        self.assertEqual(sl.cget("errorbold"),False)
+        self.assertEqual(sl.cget("errorbg"),"#f00")
+        self.assertEqual(
+            sl.configure("warningbg")[1:3],
+            ("warningBackground","WarningBackground"),
+        )
+
+        self.assertEqual(str(tk.Label.cget(sl,"background")),"white")
+        sl.warning("careful")
+        self.assertEqual(str(tk.Label.cget(sl,"background")),"orange")
+
+        # the built-in state defaults are in the option database
+        self.assertEqual(
+            str(sl.option_get("errorBackground","ErrorBackground")),
+            "#f00",
+        )
 
+    def test_construction_kwargs(self):
+        StatusLabel(self.mw)
+        init = tk.Label.__init__
+        with patch.object(
+            tk.Label,"__init__",autospec=True,side_effect=init
+        ) as mock_init:
+            sl = StatusLabel(self.mw,relief="ridge",infobg="green")
+            self.assertEqual(
+                mock_init.call_args.kwargs,
+                {"class_":"StatusLabel","text":"","relief":"ridge"},
+            )
+        # the values left to Tk match what cget reports
+        self.assertEqual(
+            str(tk.Label.cget(sl,"background")),str(sl.cget("background"))
+        )
+
+    def test_second_interpreter(self):
+        sl = StatusLabel(self.mw)
+        other = tk.Tk()
+        try:
+            other.option_add("*StatusLabel.warningBackground","orange")
+            sl2 = StatusLabel(other)
+            self.assertIs(sl2.options.root,other)
+            self.assertEqual(sl2.cget("warningbg"),"orange")
+            self.assertEqual(sl.cget("warningbg"),"#fc8")
+
+            # derived fonts are created in the label's own interpreter
+            sl2.error("oops")
+            names = other.tk.splitlist(other.tk.call("font","names"))
+            self.assertIn(sl2.cget("errorfont").name,names)
+            self.assertIsNot(sl2.cget("errorfont"),sl.cget("errorfont"))
+        finally:
+            other.destroy()
+
+    def test_reload_option_database(self):
+        first = StatusLabel(self.mw)
+        background = first.cget("background")
+
+        # entries added after the defaults were read are picked up once
+        # the option database is reloaded
+        self.mw.option_add("*StatusLabel.background","white")
+        self.mw.option_add("*StatusLabel.warningBackground","orange")
+        reload_option_database(self.mw)
+        sl = StatusLabel(self.mw)
+        self.assertEqual(str(sl.cget("background")),"white")
+        self.assertEqual(str(tk.Label.cget(sl,"background")),"white")
+        self.assertEqual(sl.cget("warningbg"),"orange")
+        self.assertEqual(sl.cget("errorbg"),"#f00")
+        self.assertEqual(first.cget("background"),background)
+
+    def test_derived_fonts(self):
+        def font_names():
+            return set(self.mw.tk.splitlist(self.mw.tk.call("font","names")))
+
+        sl1 = StatusLabel(self.mw)
+        sl2 = StatusLabel(self.mw)
+
+        # identical derived fonts are shared
+        self.assertIs(sl1.cget("errorfont"),sl2.cget("errorfont"))
+        self.assertIs(sl1.cget("warningfont"),sl2.cget("warningfont"))
+        self.assertIsNot(sl1.cget("errorfont"),sl1.cget("warningfont"))
+
+        sl1.warning("warming up")
+        sl1.error("warming up")
+        sl1.clear()
+        before = font_names()
+
+        for i in range(10000):
+            sl1.info(f"info {i}")
+            sl1.warning(f"warning {i}")
+            sl1.error(f"error {i}")
+            sl1.cget("warningfont")
+        sl1.clear()
+
+        self.assertEqual(font_names(),before)
+
+        # fonts are dropped from the pool once no label references them
+        count = _derived_fonts.count(self.mw)
+        self.assertGreater(count,0)
+        sl1.destroy()
+        self.assertEqual(_derived_fonts.count(self.mw),count)
+        sl2.destroy()
+        self.assertEqual(_derived_fonts.count(self.mw),0)
+
+    def test_diff_configure(self):
+        sl = StatusLabel(self.mw)
+        counter = sl.tk = TclCallCounter(sl.tk)
+
+        # info only differs from the normal state in its text
+        sl.info("hello")
+        self.assertEqual((counter.calls,counter.args),(1,4))
+        self.assertEqual(sl.cget("text"),"hello")
+
+        # nothing to do if neither state nor text change
+        counter.calls = counter.args = 0
+        sl.info("hello")
+        self.assertEqual((counter.calls,counter.args),(0,0))
+
+        # error changes background, foreground, font, and text
+        sl.error("oops")
+        self.assertEqual((counter.calls,counter.args),(1,10))
+        self.assertEqual(sl.cget("text"),"oops")
+
+        # only the text changes within a state
+        counter.calls = counter.args = 0
+        sl.error("oops again")
+        self.assertEqual((counter.calls,counter.args),(1,4))
+
+        # configuring an option for the current state pushes only that option
+        counter.calls = counter.args = 0
+        sl.configure(errorrelief="groove",inforelief="ridge")
+        self.assertEqual((counter.calls,counter.args),(1,4))
+        self.assertEqual(str(tk.Label.cget(sl,"relief")),"groove")
+
+        # configuring an option for another state pushes nothing
+        counter.calls = counter.args = 0
+        sl.configure(warningrelief="sunken")
+        self.assertEqual((counter.calls,counter.args),(0,0))
+
+        # clearing restores all of the modified options
+        sl.clear()
+        self.assertEqual((counter.calls,counter.args),(1,12))
+        self.assertEqual(
+            str(tk.Label.cget(sl,"background")),
+            str(sl.cget("background")),
+        )
+
+    def test_batch(self):
+        sl = StatusLabel(self.mw)
+        counter = sl.tk = TclCallCounter(sl.tk)
+
+        with sl.batch() as label:
+            self.assertIs(label,sl)
+            sl.configure(relief="ridge",padx=5)
+            sl["background"] = "green"
+            sl.warning("careful")
+            sl.configure(warningbg="orange")
+            with sl.batch():
+                sl["warningrelief"] = "groove"
+            sl.error("oops")
+            sl.info("restyled")
+            self.assertEqual(counter.calls,0)
+            self.assertEqual(sl.state,"info")
+            self.assertEqual(sl.cget("warningbg"),"orange")
+        self.assertEqual(counter.calls,1)
+
+        self.assertEqual(str(tk.Label.cget(sl,"text")),"restyled")
+        self.assertEqual(str(tk.Label.cget(sl,"relief")),"ridge")
+        self.assertEqual(str(tk.Label.cget(sl,"background")),"green")
+        self.assertEqual(str(tk.Label.cget(sl,"padx")),"5")
+
+        # nothing is pushed if nothing changed
+        counter.calls = 0
+        with sl.batch():
+            sl.info("restyled")
+        self.assertEqual(counter.calls,0)
+
+        # the deferred changes are applied even if the block raises
+        with self.assertRaises(RuntimeError):
+            with sl.batch():
+                sl.warning("raised")
+                raise RuntimeError()
+        self.assertEqual(counter.calls,1)
+        self.assertEqual(str(tk.Label.cget(sl,"text")),"raised")
+
+    def test_setitem(self):
+        sl = StatusLabel(self.mw)
+        sl["infobg"] = "green"
+        self.assertEqual(sl["infobg"],"green")
+        sl.info("hello")
+        sl["relief"] = "ridge"
+        self.assertEqual(str(tk.Label.cget(sl,"relief")),"ridge")
+        with self.assertRaises(OptionError):
+            sl["text"] = "not supported"
+
+    def wait_for_refresh(self,sl):
+        while sl._refresh_id is not None:
+            self.mw.update()
+            time.sleep(0.005)
+
+    def test_throttled_updates(self):
+        sl = StatusLabel(self.mw,max_refresh_hz=20)
+
+        for i in range(100):
+            sl.info(f"progress {i}")
+        self.assertIsNone(sl.state)
+        self.assertEqual(sl.cget("text"),"")
+
+        self.wait_for_refresh(sl)
+        self.assertEqual(sl.state,"info")
+        self.assertEqual(sl.cget("text"),"progress 99")
+
+        # the last request always wins
+        sl.warning("first")
+        sl.info("second")
+        sl.warning("third")
+        self.wait_for_refresh(sl)
+        self.assertEqual(sl.state,"warning")
+        self.assertEqual(sl.cget("text"),"third")
+
+        # errors bypass the throttle and discard older pending requests
+        sl.info("pending")
+        sl.error("now")
+        self.assertEqual(sl.state,"error")
+        self.assertEqual(sl.cget("text"),"now")
+        self.wait_for_refresh(sl)
+        self.assertEqual(sl.cget("text"),"now")
+
+        sl.clear("done")
+        self.wait_for_refresh(sl)
+        self.assertIsNone(sl.state)
+        self.assertEqual(sl.cget("text"),"done")
+
+    def test_throttled_errors(self):
+        sl = StatusLabel(self.mw,max_refresh_hz=20,throttle_errors=True)
+        sl.error("later")
+        self.assertIsNone(sl.state)
+        self.wait_for_refresh(sl)
+        self.assertEqual(sl.state,"error")
+        self.assertEqual(sl.cget("text"),"later")
+
+        # pending requests are discarded when the widget is destroyed
+        sl.info("never shown")
+        sl.destroy()
+        self.mw.update()
+
+    def wait_for_effect(self,sl,timeout=2):
+        deadline = time.monotonic() + timeout
+        while sl._effect is not None and time.monotonic() < deadline:
+            self.mw.update()
+            time.sleep(0.005)
+
+    def test_error_timeout(self):
+        sl = StatusLabel(self.mw)
+        start = time.monotonic()
+        sl.error("temporary",timeout=0.1)
+        self.assertEqual(sl.state,"error")
+        self.wait_for_effect(sl)
+        self.assertGreaterEqual(time.monotonic() - start,0.1)
+        self.assertIsNone(sl.state)
+        self.assertEqual(sl.cget("text"),"")
+
+        # a new status cancels the auto-clear
+        sl.error("temporary",timeout=0.05)
+        sl.warning("lasting")
+        self.assertIsNone(sl._effect)
+        time.sleep(0.1)
+        self.mw.update()
+        self.assertEqual(sl.state,"warning")
+
+        # destroying the widget cancels it as well
+        sl.error("gone",timeout=0.05)
+        timer = sl._effect
+        sl.destroy()
+        self.assertFalse(timer.pending)
+
+    def test_warning_flash(self):
+        sl = StatusLabel(self.mw)
+        sl.flash_count = 4
+        sl.flash_interval = 0.01
+        warning_bg = str(sl.cget("warningbg"))
+        normal_bg = str(sl.cget("background"))
+
+        backgrounds = []
+        apply = sl._apply
+        def record(*args,**kwargs):
+            apply(*args,**kwargs)
+            backgrounds.append(str(tk.Label.cget(sl,"background")))
+        sl._apply = record
+
+        sl.warning("look at me",flash=True)
+        self.wait_for_effect(sl)
+        self.assertEqual(
+            backgrounds,
+            [warning_bg,normal_bg,warning_bg,normal_bg,warning_bg],
+        )
+        self.assertEqual(sl.state,"warning")
+        self.assertEqual(sl.cget("text"),"look at me")
+
+    def test_from_prototype(self):
+        proto = StatusLabel(self.mw,infobg="green",relief="ridge")
+        sl = StatusLabel.from_prototype(self.mw,proto,"hello",errorbg="blue")
+        self.assertEqual(sl.cget("text"),"hello")
+        self.assertEqual(sl.cget("infobg"),"green")
+        self.assertEqual(sl.cget("relief"),"ridge")
+        self.assertEqual(sl.cget("errorbg"),"blue")
+        self.assertNotEqual(proto.cget("errorbg"),"blue")
+        self.assertEqual(str(tk.Label.cget(sl,"relief")),"ridge")
+
+        frame = tk.Frame(self.mw)
+        clone = sl.clone(frame)
+        self.assertIs(clone.master,frame)
+        self.assertEqual(clone.cget("errorbg"),"blue")
+        self.assertIs(sl.clone().master,self.mw)
+
+        # modifying a clone does not affect its prototype
+        clone.configure(infobg="red")
+        self.assertEqual(sl.cget("infobg"),"green")
+        self.assertEqual(proto.cget("infobg"),"green")
+        clone.info("clone")
+        self.assertEqual(str(tk.Label.cget(clone,"background")),"red")
+
+    def test_history(self):
+        sl = StatusLabel(self.mw)
+        self.assertIsNone(sl.history)
+
+        sl = StatusLabel(self.mw,max_refresh_hz=20,history_size=3)
+        sl.info("one")
+        sl.warning("two")
+        sl.error("three")
+        sl.clear("four")
+        self.assertEqual(
+            [(state,text) for _,state,text in sl.history],
+            [("warning","two"),("error","three"),(None,"four")],
+        )
+        # throttled requests are recorded even if never shown
+        self.wait_for_refresh(sl)
+        self.assertEqual(sl.cget("text"),"four")
+        self.assertEqual(sl.history.last(1)[0][1:],(None,"four"))
@@ -0,0 +1,127 @@
+# Author: Michael A. Mayer
+# Copyright: 2023, VMWishes
+# License: UNLICENSE (http://unlicense.org)
+
+import unittest
+
+import tkinter as tk
+
+from mmtk.status_label import StatusLabel, Options, OptionError
+from mmtk.status_palette import StatusPalette
+
+from test.test_status_label import TclCallCounter
+
+class TestPaletteSpec(unittest.TestCase):
+    def test_updates(self):
+        palette = StatusPalette(
+            None,
+            {None:{"bg":"black"}, "error":{"bold":False}},
+            infofg="cyan",
+        )
+        updates = {(option,state):value for option,state,value in palette.updates}
+        self.assertEqual(updates[("background",None)],"black")
+        self.assertEqual(updates[("foreground","info")],"cyan")
+        self.assertEqual(updates[("bold","error")],False)
+
+        # unspecified states of covered options take the built-in defaults
+        self.assertEqual(updates[("background","error")],"#f00")
+        self.assertEqual(updates[("foreground",None)],None)
+        self.assertEqual(updates[("bold","info")],False)
+        self.assertNotIn(("bold",None),updates)
+
+        # other options are not covered
+        self.assertEqual(
+            {option for option,_ in updates},
+            {"background","foreground","bold"},
+        )
+
+    def test_named(self):
+        for name in ("default","night","high_contrast"):
+            self.assertEqual(StatusPalette.named(name).name,name)
+        palette = StatusPalette("test_named",relief="ridge")
+        self.assertIs(StatusPalette.named("test_named"),palette)
+        del StatusPalette.palettes["test_named"]
+        with self.assertRaises(OptionError):
+            StatusPalette.named("test_named")
+
+    def test_invalid(self):
+        for states in (
+            {"junk":{"background":"red"}},
+            {"info":{"infobg":"red"}},
+            {None:{"bold":True}},
+            {None:{"text":"hello"}},
+        ):
+            with self.assertRaises(OptionError):
+                StatusPalette(None,states)
+        with self.assertRaises(OptionError):
+            StatusPalette(None,squishy=True)
+
+
+class TestPaletteApply(unittest.TestCase):
+    def setUp(self):
+        self.mw = tk.Tk()
+
+    def tearDown(self):
+        self.mw.destroy()
+
+    def test_apply(self):
+        night = StatusPalette.named("night")
+        labels = [StatusLabel(self.mw,relief="ridge") for _ in range(3)]
+        labels[1].warning("careful")
+        labels[2].error("oops")
+
+        counters = [TclCallCounter(label.tk) for label in labels]
+        for label,counter in zip(labels,counters):
+            label.tk = counter
+        night.apply(labels)
+        self.assertEqual([counter.calls for counter in counters],[1,1,1])
+
+        self.assertEqual(str(tk.Label.cget(labels[0],"background")),"#222")
+        self.assertEqual(str(tk.Label.cget(labels[1],"background")),"#640")
+        self.assertEqual(str(tk.Label.cget(labels[2],"background")),"#900")
+        for label in labels:
+            self.assertEqual(label.cget("relief"),"ridge")
+            self.assertEqual(label.cget("infofg"),"#8cf")
+
+        # the palette's options are shared until modified
+        for label in labels:
+            self.assertIs(
+                label.options.options["background"],
+                night.options()["background"],
+            )
+        labels[0].configure(infobg="green")
+        self.assertEqual(labels[0].cget("infobg"),"green")
+        self.assertIsNone(night.options()["background"].value("info"))
+        self.assertIs(labels[0].options.options["bg"].target,
+                      labels[0].options.options["background"])
+
+        # reapplying the same palette leaves unchanged labels untouched
+        for counter in counters:
+            counter.calls = 0
+        night.apply(labels[1:])
+        self.assertEqual([counter.calls for counter in counters],[0,0,0])
+
+        # the default palette restores the built-in values
+        StatusPalette.named("default").apply(labels)
+        self.assertEqual(labels[1].cget("warningbg"),"#fc8")
+        self.assertEqual(
+            labels[0].cget("background"),
+            Options().cget("background"),
+        )
+        self.assertEqual(str(tk.Label.cget(labels[2],"background")),"#f00")
+
+    def test_font_defaults(self):
+        label = StatusLabel(self.mw)
+        expected = {
+            key:label.configure(key)
+            for key in ("errorbold","warningitalic","infobold","background")
+        }
+        for name in ("default","high_contrast"):
+            StatusPalette.named(name).apply([label])
+            for key,config in expected.items():
+                # the defaults are unchanged by the palette
+                self.assertEqual(label.configure(key)[:4],config[:4])
+        self.assertTrue(label.cget("warningbold"))
+
+if __name__ == '__main__':
+    unittest.main()